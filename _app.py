@@ -1,21 +1,27 @@
 #!/usr/bin/env python3
-import sys, os, json, cv2, time
+import sys, os, json, cv2, time, threading, shutil, subprocess, hashlib, bisect, struct, heapq
+from multiprocessing import shared_memory
+from collections import deque, OrderedDict
+import numpy as np
 from pytube import YouTube
 import yt_dlp
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QMainWindow, QPushButton, QToolButton,
-    QListWidget, QListWidgetItem, QHBoxLayout, QVBoxLayout,
+    QListWidget, QListWidgetItem, QListView, QStyledItemDelegate, QHBoxLayout, QVBoxLayout,
     QLabel, QComboBox, QMenu, QStyle,
     QDialog, QFormLayout, QSpinBox, QDoubleSpinBox,
     QLineEdit, QColorDialog, QDialogButtonBox, QCheckBox,
     QInputDialog, QProgressBar, QMessageBox, QTextEdit, QSizePolicy,
-    QAbstractItemView, QGraphicsOpacityEffect, QScrollArea,
-    QFrame
+    QAbstractItemView, QScrollArea,
+    QFrame, QSlider
 )
 from PyQt5.QtCore import (Qt, QTimer, QPropertyAnimation, 
-    pyqtSignal, pyqtSlot, QEasingCurve, QSize, QThread)
-from PyQt5.QtGui import QColor, QImage, QPixmap, QIcon
+    pyqtSignal, pyqtSlot, pyqtProperty, QEasingCurve, QSize, QThread,
+    QRect, QPoint, QObject, QEvent, QProcess, QAbstractListModel, QModelIndex)
+from PyQt5.QtGui import QColor, QImage, QPixmap, QIcon, QPainter, QFont, QFontMetrics
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+from PyQt5 import sip
 
 # === Config paths ===
 BASE_DIR = os.getcwd()
@@ -24,6 +30,48 @@ VIDEOS_DIR = os.path.join(BASE_DIR, "videos")
 CONFIG_DIR = os.path.join(BASE_DIR, "config")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "defaults.json")
 VIDEO_EXTS = {".mp4", ".avi", ".mov", ".mkv", ".wmv"}
+VIDEO_SCALE_MODES = ["fit", "fill", "crop"]
+# "video" draws lyrics over the background video; the other two are
+# lyrics-only outputs (e.g. for livestream overlays) that never decode video
+OUTPUT_MODES = ["video", "transparent", "key_color"]
+# Frames stay in OpenCV's BGR order when Qt can show that directly (Qt 5.14+)
+FRAME_IS_BGR = hasattr(QImage, 'Format_BGR888')
+FRAME_IMAGE_FORMAT = QImage.Format_BGR888 if FRAME_IS_BGR else QImage.Format_RGB888
+FRAME_POOL_LIMIT = 16             # spare frame buffers kept for reuse
+PROXY_DIR = os.path.join(VIDEOS_DIR, ".proxies")
+# Proxy tiers, smallest first: (name, max width, max height, max fps)
+PROXY_TIERS = [
+    ("preview", 640, 360, 30),
+    ("projector", 1280, 720, 30)
+]
+PROXY_KEYFRAME_INTERVAL = 15      # frames between keyframes in a proxy
+PROXY_INDEX_FILE = os.path.join(PROXY_DIR, "proxies.json")
+LOOP_CACHE_DIR = os.path.join(VIDEOS_DIR, ".cache")
+KEYFRAME_INDEX_FILE = os.path.join(LOOP_CACHE_DIR, "keyframes.json")
+FIRST_FRAME_DIR = os.path.join(LOOP_CACHE_DIR, "first_frames")
+LOOP_POINTS_FILE = os.path.join(VIDEOS_DIR, ".loop_points.json")
+VIDEO_METADATA_FILE = os.path.join(VIDEOS_DIR, ".metadata.json")
+INDEX_WRITE_BATCH = 64            # entries a library pass stores between index writes
+THUMBNAIL_DIR = os.path.join(VIDEOS_DIR, ".thumbnails")
+THUMBNAIL_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+THUMBNAIL_SIZE = (120, 70)        # thumbnails are stored at the size the list shows them
+THUMBNAIL_CACHE_SIZE = 512        # thumbnail pixmaps kept in memory
+FILMSTRIP_DIR = os.path.join(VIDEOS_DIR, ".filmstrips")
+FILMSTRIP_FRAMES = 12             # frames in a hover-scrub filmstrip
+FILMSTRIP_CACHE_SIZE = 64         # filmstrip pixmaps kept in memory
+VIDEO_ROW_HEIGHT = THUMBNAIL_SIZE[1] + 30   # height of a row in the video library
+LOOP_PREBUFFER_FRAMES = 8         # loop-start frames decoded ahead of each wrap
+LYRIC_CACHE_SIZE = 64             # rendered lyric images kept in memory
+LYRIC_LOOKAHEAD = 3               # upcoming slides rendered ahead of time
+LYRIC_TEXT_FLAGS = Qt.AlignCenter | Qt.TextWordWrap
+LYRIC_TRANSITIONS = ["fade", "crossfade", "slide", "cut"]
+NEXT_LINE_OPACITY = 0.5           # the next-line preview is shown at half opacity
+AUTO_FIT_MIN_SIZE = 12            # auto-fit never shrinks text below this size
+PRESENTER_SERVER_NAME = "jsgc-lingunan-presenter"   # local socket of the presenter process
+PRESENTER_RESPAWN_INTERVAL = 5.0  # seconds between attempts to restart the presenter
+PRESENTER_RELEASE_TIMEOUT = 3.0   # seconds to wait for the presenter to close its videos
+FRAME_SINK_MAGIC = b"JSGCFRM1"    # first bytes of a frame sink segment (see SharedFrameSink)
+FRAME_SINK_FORMAT_BGRA = 1        # 8-bit B, G, R, A with premultiplied alpha
 DEFAULT_VIDEO_URLS = [
     "https://www.youtube.com/watch?v=lvqsmF2ASY8",
     "https://www.youtube.com/watch?v=JOmPR8RH56M",
@@ -40,7 +88,32 @@ DEFAULTS = {
     "margins": [50, 0, 50, 0],
     "italic": False,
     "fade_duration": 0.5,
-    "show_next_line": False
+    "lyric_transition": "crossfade",
+    "text_outline_width": 0,
+    "text_shadow_size": 0,
+    "text_glow_size": 0,
+    "text_effect_color": "#000000",
+    "auto_fit_font": False,
+    "auto_fit_max_size": 120,
+    "video_crossfade_duration": 1.0,
+    "show_next_line": False,
+    "frame_buffer_depth": 3,
+    "video_scale_mode": "fill",
+    "use_proxies": True,
+    "output_mode": "video",
+    "key_color": "#00ff00",
+    "loop_cache_clip_mb": 1024,
+    "loop_cache_quota_mb": 8192,
+    "decoder_pool_size": 3,
+    "presenter_process": True,
+    "frame_sink": False,
+    "frame_sink_name": "jsgc-presenter-frames",
+    "frame_sink_size": [1920, 1080],
+    "frame_sink_slots": 3,
+    "outputs": [
+        {"name": "Stage", "enabled": False, "video": False, "next_line": True},
+        {"name": "Preview", "enabled": False, "video": True, "next_line": False}
+    ]
 }
 
 def load_defaults():
@@ -104,6 +177,1723 @@ class DownloadThread(QThread):
         except Exception as e:
             self.error.emit(f"{e}")
 
+def scaled_size(src_w, src_h, width, height, mode="fill"):
+    """Return the (width, height) scale_frame produces for a source size."""
+    if width <= 0 or height <= 0:
+        return src_w, src_h
+    if mode == "fit":
+        scale = min(width / src_w, height / src_h)
+        return max(1, round(src_w * scale)), max(1, round(src_h * scale))
+    return width, height
+
+def scale_frame(frame, width, height, mode="fill", dst=None):
+    """Scale a decoded frame for a width x height output.
+
+    fit:  keep the whole frame, letterboxed inside the output
+    fill: stretch the frame to exactly the output size
+    crop: cover the output, cutting the overflow off the frame
+
+    With dst (an array of the output shape) the result is written there
+    instead of into a new array.
+    """
+    src_h, src_w = frame.shape[:2]
+    width, height = scaled_size(src_w, src_h, width, height, mode)
+    if dst is not None and dst.shape[:2] != (height, width):
+        dst = None
+    if mode == "crop":
+        # Slice out the centered region with the output's aspect ratio.
+        # This is a view into the decoded frame, no pixels are copied.
+        if src_w * height > width * src_h:
+            crop_w = max(1, round(src_h * width / height))
+            x = (src_w - crop_w) // 2
+            frame = frame[:, x:x + crop_w]
+        else:
+            crop_h = max(1, round(src_w * height / width))
+            y = (src_h - crop_h) // 2
+            frame = frame[y:y + crop_h]
+        src_h, src_w = frame.shape[:2]
+    if (src_w, src_h) == (width, height):
+        if dst is None:
+            return frame
+        np.copyto(dst, frame)
+        return dst
+    # Area filtering when shrinking, bilinear when enlarging
+    interpolation = cv2.INTER_AREA if width < src_w else cv2.INTER_LINEAR
+    return cv2.resize(frame, (width, height), dst=dst, interpolation=interpolation)
+
+class FramePool:
+    """Preallocated frame buffers, reused instead of allocating per frame.
+
+    Decoder threads take buffers to scale frames into; the presenter puts
+    them back once they are off screen. Only arrays that own their memory
+    are taken back, so views into a memmap are never written to.
+    """
+
+    def __init__(self, limit=FRAME_POOL_LIMIT):
+        self.limit = limit
+        self._free = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def get(self, shape):
+        with self._lock:
+            free = self._free.get(shape)
+            if free:
+                self._count -= 1
+                return free.pop()
+        return np.empty(shape, np.uint8)
+
+    def put(self, buf):
+        if buf is None or not buf.flags.owndata or not buf.flags.writeable:
+            return
+        with self._lock:
+            if self._count >= self.limit:
+                # Keep buffers of the newest size; older sizes go first
+                for shape in list(self._free):
+                    if shape != buf.shape and self._free[shape]:
+                        self._free[shape].pop()
+                        self._count -= 1
+                        break
+                else:
+                    return
+            self._free.setdefault(buf.shape, []).append(buf)
+            self._count += 1
+
+def prepare_frame(frame, width, height, mode="fill", pool=None):
+    """Scale a decoded BGR frame into a (pooled) buffer ready for display.
+
+    The result is in FRAME_IMAGE_FORMAT order and never shares memory with
+    frame, so the capture can decode the next frame into the same array.
+    """
+    src_h, src_w = frame.shape[:2]
+    out_w, out_h = scaled_size(src_w, src_h, width, height, mode)
+    shape = (out_h, out_w, 3)
+    dst = pool.get(shape) if pool is not None else np.empty(shape, np.uint8)
+    out = scale_frame(frame, width, height, mode, dst)
+    if not FRAME_IS_BGR:
+        cv2.cvtColor(out, cv2.COLOR_BGR2RGB, dst=out)
+    return out
+
+def load_loop_points():
+    """Return the saved in/out loop points, {file name: {"in": s, "out": s}}."""
+    try:
+        with open(LOOP_POINTS_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_loop_points(points):
+    with open(LOOP_POINTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(points, f, indent=2)
+
+def scan_keyframes(path):
+    """Return (keyframe indices, frame count) of a video.
+
+    Only packets are read, nothing is decoded, so this takes milliseconds.
+    """
+    cap = cv2.VideoCapture(path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+    keyframes = []
+    count = 0
+    try:
+        while cap.isOpened() and cap.grab():
+            if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                keyframes.append(count)
+            count += 1
+    finally:
+        cap.release()
+    return keyframes or [0], count
+
+def keyframe_before(keyframes, target):
+    """Return the last keyframe at or before frame target."""
+    i = bisect.bisect_right(keyframes, target) - 1
+    return keyframes[i] if i >= 0 else 0
+
+def write_json_atomic(path, data):
+    """Write data as JSON so readers see either the old file or the new one."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+class JsonIndex:
+    """Per-video entries kept in one JSON file, keyed on path and valid
+    only while the video's size and mtime are unchanged.
+
+    The file is re-read whenever it changed on disk, so indexes of the
+    same file in the control window and the presenter process see and add
+    to each other's entries. New entries are written batch at a time, and
+    whatever is left by flush(), so a pass over a large library rewrites
+    the file a handful of times rather than once per video.
+    """
+
+    def __init__(self, path, label="index", batch=1):
+        self.path = path
+        self.label = label
+        self.batch = max(1, batch)       # entries to collect before writing
+        self._lock = threading.Lock()
+        self._entries = None
+        self._pending = {}               # stored but not yet written
+        self._mtime = None               # of the file when last read or written
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self):
+        """Re-read the file if it changed on disk; call with the lock held."""
+        if self._entries is not None and self._file_mtime() == self._mtime:
+            return
+        self._mtime = self._file_mtime()
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+        self._entries.update(self._pending)
+
+    def _save(self):
+        """Write the entries, pending ones included; call with the lock held."""
+        self._refresh()
+        try:
+            write_json_atomic(self.path, self._entries)
+        except OSError as e:
+            print(f"Could not save {self.label}: {e}")
+            return
+        self._pending.clear()
+        self._mtime = self._file_mtime()
+
+    @staticmethod
+    def _stat(video_path):
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def lookup(self, video_path, stat=None):
+        """Return the current entry of a video, or None. stat is the
+        video's (size, mtime) when the caller already has it."""
+        if stat is None:
+            stat = self._stat(video_path)
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(os.path.abspath(video_path))
+        if entry and stat and (entry['size'], entry['mtime']) == stat:
+            return entry
+        return None
+
+    def store(self, video_path, **fields):
+        """Save an entry for a video as it is now; return it, or None if
+        the video is gone."""
+        stat = self._stat(video_path)
+        if stat is None:
+            return None
+        entry = dict(fields, size=stat[0], mtime=stat[1])
+        key = os.path.abspath(video_path)
+        with self._lock:
+            self._refresh()
+            self._entries[key] = entry
+            self._pending[key] = entry
+            if len(self._pending) >= self.batch:
+                self._save()
+        return entry
+
+    def flush(self):
+        """Write the entries stored since the last write."""
+        with self._lock:
+            if self._pending:
+                self._save()
+
+    def prune(self, video_paths):
+        """Forget the videos that are no longer in the library."""
+        keep = {os.path.abspath(p) for p in video_paths}
+        with self._lock:
+            self._refresh()
+            stale = [key for key in self._entries if key not in keep]
+            for key in stale:
+                del self._entries[key]
+                self._pending.pop(key, None)
+            if stale:
+                self._save()
+
+class KeyframeIndex(JsonIndex):
+    """Persistent keyframe index of the videos, keyed on path, size and mtime."""
+
+    def __init__(self, path, batch=1):
+        super().__init__(path, "keyframe index", batch)
+
+    def scan(self, video_path):
+        """Return the entry ('keyframes', 'frames') of a video, scanning it
+        on first use, or None if the file is gone."""
+        entry = self.lookup(video_path)
+        if entry is None:
+            keyframes, count = scan_keyframes(video_path)
+            entry = self.store(video_path, frames=count, keyframes=keyframes)
+        return entry
+
+    def get(self, video_path):
+        """Return the keyframe indices of a video, scanning it on first use."""
+        entry = self.scan(video_path)
+        return entry['keyframes'] if entry else [0]
+
+def probe_video(path, keyframe_index):
+    """Return the metadata the video library shows for a file.
+
+    Frame count and keyframes come from keyframe_index, which the decoder
+    shares, so a file's packets are only ever scanned once.
+    """
+    cap = cv2.VideoCapture(path)
+    try:
+        if not cap.isOpened():
+            raise OSError(f"Could not open video: {path}")
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        cap.release()
+    codec = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ")
+    entry = keyframe_index.scan(path)
+    keyframes = entry['keyframes'] if entry else [0]
+    frames = (entry['frames'] if entry else 0) or frames
+    return {
+        'duration': frames / fps if fps else 0.0,
+        'fps': fps,
+        'width': width,
+        'height': height,
+        'codec': codec,
+        'frames': frames,
+        'keyframe_interval': round(frames / len(keyframes)) if frames else 0
+    }
+
+def format_video_info(size_bytes, meta=None):
+    """Return the one-line summary shown under a video in the library."""
+    parts = [f"{size_bytes / (1024 * 1024):.1f} MB"]
+    if meta:
+        minutes, seconds = divmod(int(round(meta['duration'])), 60)
+        parts.append(f"{minutes}:{seconds:02d}")
+        parts.append(f"{meta['width']}x{meta['height']}")
+        parts.append(f"{meta['fps']:.3g} fps")
+        if meta['codec']:
+            parts.append(meta['codec'])
+    return " \u00b7 ".join(parts)
+
+class VideoMetadataIndex(JsonIndex):
+    """Persistent metadata of the video library, keyed on path, size and mtime.
+
+    Lookups never open a video: an entry is either current or missing, and
+    missing ones are filled in by MetadataProbeThread.
+    """
+
+    def __init__(self, path, batch=1):
+        super().__init__(path, "video metadata", batch)
+
+    def get(self, video_path, stat=None):
+        """Return the metadata of a video, or None if it has to be probed."""
+        entry = self.lookup(video_path, stat)
+        return entry['meta'] if entry else None
+
+    def put(self, video_path, meta):
+        self.store(video_path, meta=meta)
+
+class MetadataProbeThread(QThread):
+    """Probes videos missing from a VideoMetadataIndex, one at a time.
+
+    More videos can be handed to a running thread with add(); it exits
+    once it runs out, writing what the indexes have still batched. While
+    paused it finishes the current video and then waits.
+    """
+    probed = pyqtSignal(str, dict)   # emits path, metadata
+    error  = pyqtSignal(str)         # emits error message
+
+    def __init__(self, index, keyframe_index, video_paths, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.keyframe_index = keyframe_index
+        self._cond = threading.Condition()
+        self._pending = list(video_paths)
+        self._done = False
+        self._paused = False
+        self._cancelled = False
+
+    def add(self, video_paths):
+        """Replace the videos still to probe; False if the thread has
+        already finished and a new one is needed."""
+        with self._cond:
+            if self._done:
+                return False
+            self._pending = list(video_paths)
+            return True
+
+    def cancel(self):
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def set_paused(self, paused):
+        with self._cond:
+            self._paused = paused
+            self._cond.notify_all()
+
+    def _next(self):
+        with self._cond:
+            while self._paused and not self._cancelled:
+                self._cond.wait()
+            if self._cancelled or not self._pending:
+                self._done = True
+                return None
+            return self._pending.pop(0)
+
+    def run(self):
+        try:
+            while True:
+                path = self._next()
+                if path is None:
+                    return
+                if self.index.get(path) is not None:
+                    continue             # probed while it was queued twice
+                try:
+                    meta = probe_video(path, self.keyframe_index)
+                except Exception as e:
+                    self.error.emit(f"Could not probe {os.path.basename(path)}: {e}")
+                    continue
+                self.index.put(path, meta)
+                self.probed.emit(path, meta)
+        finally:
+            self.index.flush()
+            self.keyframe_index.flush()
+
+class ThumbnailAtlas:
+    """Every video thumbnail in one file, with an index keyed on path, size
+    and mtime.
+
+    Thumbnails are raw tiles of THUMBNAIL_SIZE in a growing memmap, so
+    reading one is a slice and adding one touches only its own tile. A
+    file that was renamed or copied is recognised by a fingerprint of its
+    size and first and last bytes and shares the existing tile; a replaced
+    file gets a new one, and tiles no file refers to are reused.
+    """
+    VERSION = 1
+    FINGERPRINT_BYTES = 65536
+
+    def __init__(self, root, tile=THUMBNAIL_SIZE):
+        self.root = root
+        self.tile = tuple(tile)
+        self.data_path = os.path.join(root, "atlas.bgr")
+        self.index_path = os.path.join(root, "atlas.json")
+        self._lock = threading.RLock()
+        self._index = None
+        self._tiles = None
+
+    def _empty_index(self):
+        return {'version': self.VERSION, 'tile': list(self.tile), 'capacity': 0,
+                'entries': {}, 'content': {}, 'free': []}
+
+    def _open(self):
+        """Load the index and map the tiles, once; call with the lock held."""
+        if self._index is not None:
+            return
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+        if (not index or index.get('version') != self.VERSION
+                or tuple(index.get('tile', ())) != self.tile
+                or not os.path.exists(self.data_path)):
+            index = self._empty_index()
+        self._index = index
+        self._map(index['capacity'])
+
+    def _map(self, capacity):
+        w, h = self.tile
+        self._tiles = None
+        if capacity == 0:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.data_path, 'ab') as f:
+            f.truncate(capacity * w * h * 3)
+        self._tiles = np.memmap(self.data_path, np.uint8, 'r+', shape=(capacity, h, w, 3))
+
+    def _save(self):
+        write_json_atomic(self.index_path, self._index)
+
+    # Same key as the other per-video indexes, so they agree on staleness
+    _stat = staticmethod(JsonIndex._stat)
+
+    @classmethod
+    def fingerprint(cls, video_path, size):
+        digest = hashlib.sha1(str(size).encode('ascii'))
+        with open(video_path, 'rb') as f:
+            digest.update(f.read(cls.FINGERPRINT_BYTES))
+            if size > cls.FINGERPRINT_BYTES:
+                f.seek(max(cls.FINGERPRINT_BYTES, size - cls.FINGERPRINT_BYTES))
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def lookup(self, video_path, stat=None):
+        """Return the tile slot of a video's current thumbnail, or None."""
+        if stat is None:
+            stat = self._stat(video_path)
+        with self._lock:
+            self._open()
+            entry = self._index['entries'].get(os.path.abspath(video_path))
+        if entry and stat and (entry['size'], entry['mtime']) == stat:
+            return entry['slot']
+        return None
+
+    def image(self, video_path, stat=None):
+        """Return a video's thumbnail as a QImage of THUMBNAIL_SIZE, or None."""
+        slot = self.lookup(video_path, stat)
+        if slot is None:
+            return None
+        with self._lock:
+            tile = np.array(self._tiles[slot])
+        if not FRAME_IS_BGR:
+            tile = cv2.cvtColor(tile, cv2.COLOR_BGR2RGB)
+        h, w, _ = tile.shape
+        return QImage(tile.data, w, h, 3 * w, FRAME_IMAGE_FORMAT).copy()
+
+    def generate(self, video_path):
+        """Make sure a video has a current thumbnail; return whether it has.
+
+        A matching tile of the same content is reused; otherwise the
+        thumbnail is taken from the video's JPEG of older versions, if that
+        is newer than the video, or from its first frame.
+        """
+        if self.lookup(video_path) is not None:
+            return True
+        stat = self._stat(video_path)
+        if stat is None:
+            return False
+        fingerprint = self.fingerprint(video_path, stat[0])
+        with self._lock:
+            self._open()
+            slot = self._index['content'].get(fingerprint)
+            if slot is not None:
+                self._link(video_path, stat, fingerprint, slot)
+                return True
+        frame = None
+        stem = os.path.splitext(os.path.basename(video_path))[0]
+        legacy_path = os.path.join(self.root, f"{stem}.jpg")
+        if os.path.exists(legacy_path) and os.stat(legacy_path).st_mtime_ns >= stat[1]:
+            frame = cv2.imread(legacy_path)
+        if frame is None:
+            cap = cv2.VideoCapture(video_path)
+            try:
+                ret, frame = cap.read()
+            finally:
+                cap.release()
+            if not ret:
+                return False
+        # Decoded straight to the size it is shown at
+        tile = cv2.resize(frame, self.tile, interpolation=cv2.INTER_AREA)
+        with self._lock:
+            self._open()
+            slot = self._allocate()
+            self._tiles[slot] = tile
+            self._tiles.flush()
+            self._index['content'][fingerprint] = slot
+            self._link(video_path, stat, fingerprint, slot)
+        return True
+
+    def _allocate(self):
+        index = self._index
+        if index['free']:
+            return index['free'].pop()
+        # Grow by doubling, so adding n thumbnails remaps log(n) times
+        slot = index['capacity']
+        index['capacity'] = max(16, 2 * slot)
+        index['free'] = list(range(index['capacity'] - 1, slot, -1))
+        self._map(index['capacity'])
+        return slot
+
+    def _link(self, video_path, stat, fingerprint, slot):
+        old = self._index['entries'].get(os.path.abspath(video_path))
+        self._index['entries'][os.path.abspath(video_path)] = {
+            'size': stat[0],
+            'mtime': stat[1],
+            'fingerprint': fingerprint,
+            'slot': slot
+        }
+        if old and old['slot'] != slot:
+            self._release([old])
+        try:
+            self._save()
+        except OSError as e:
+            print(f"Could not save thumbnail index: {e}")
+
+    def _release(self, entries):
+        """Free the tiles of removed entries that nothing else refers to."""
+        used = {e['slot'] for e in self._index['entries'].values()}
+        for entry in entries:
+            slot = entry['slot']
+            if slot not in used and slot not in self._index['free']:
+                self._index['free'].append(slot)
+                if self._index['content'].get(entry['fingerprint']) == slot:
+                    del self._index['content'][entry['fingerprint']]
+
+    def prune(self, video_paths):
+        """Forget the videos that are no longer in the library."""
+        keep = {os.path.abspath(p) for p in video_paths}
+        with self._lock:
+            self._open()
+            entries = self._index['entries']
+            stale = [key for key in entries if key not in keep]
+            if not stale:
+                return
+            removed = [entries.pop(key) for key in stale]
+            self._release(removed)
+            try:
+                self._save()
+            except OSError as e:
+                print(f"Could not save thumbnail index: {e}")
+
+class FilmstripCache:
+    """Hover-scrub filmstrips: frames sampled evenly across each video,
+    side by side in one small JPEG per video, keyed on path, size and mtime.
+
+    generate() decodes (on a worker thread); pixmap() only loads the strip,
+    so scrubbing through it never touches the video.
+    """
+
+    def __init__(self, root, frames=FILMSTRIP_FRAMES, tile=THUMBNAIL_SIZE,
+                 limit=FILMSTRIP_CACHE_SIZE):
+        self.root = root
+        self.frames = frames
+        self.tile = tuple(tile)
+        self.limit = limit
+        self._pixmaps = OrderedDict()
+        self._names = {}                 # (path, size, mtime) -> strip file name
+
+    def strip_path(self, video_path, stat=None):
+        if stat is None:
+            stat = JsonIndex._stat(video_path)
+            if stat is None:
+                return None
+        key = (os.path.abspath(video_path),) + tuple(stat)
+        name = self._names.get(key)
+        if name is None:
+            raw = f"{key[0]}|{stat[0]}|{stat[1]}|{self.frames}|{self.tile}"
+            name = self._names[key] = hashlib.sha1(raw.encode('utf-8')).hexdigest() + ".jpg"
+        return os.path.join(self.root, name)
+
+    def lookup(self, video_path, stat=None):
+        """Return the strip file of a video, or None if it is not made yet."""
+        path = self.strip_path(video_path, stat)
+        return path if path and os.path.exists(path) else None
+
+    def generate(self, video_path):
+        """Make sure a video has a current filmstrip; return whether it has."""
+        out = self.strip_path(video_path)
+        if out is None:
+            return False
+        if os.path.exists(out):
+            return True
+        w, h = self.tile
+        strip = np.zeros((h, w * self.frames, 3), np.uint8)
+        cap = cv2.VideoCapture(video_path)
+        try:
+            count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            if not cap.isOpened() or count <= 0:
+                return False
+            got = 0
+            for i in range(self.frames):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, int((i + 0.5) * count / self.frames))
+                ret, frame = cap.read()
+                if ret:
+                    strip[:, i * w:(i + 1) * w] = cv2.resize(frame, (w, h), interpolation=cv2.INTER_AREA)
+                    got += 1
+        finally:
+            cap.release()
+        if not got:
+            return False
+        os.makedirs(self.root, exist_ok=True)
+        tmp = out[:-len(".jpg")] + ".tmp.jpg"
+        cv2.imwrite(tmp, strip, [int(cv2.IMWRITE_JPEG_QUALITY), 80])
+        os.replace(tmp, out)
+        return True
+
+    def pixmap(self, video_path, stat=None):
+        """Return a video's filmstrip, or None. Call on the GUI thread."""
+        path = self.strip_path(video_path, stat)
+        if path is None:
+            return None
+        pixmap = self._pixmaps.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                return None
+            self._pixmaps[path] = pixmap
+            while len(self._pixmaps) > self.limit:
+                self._pixmaps.popitem(last=False)
+        else:
+            self._pixmaps.move_to_end(path)
+        return pixmap
+
+    def frame(self, video_path, fraction, stat=None):
+        """Return the strip frame at fraction (0-1) through a video, or None."""
+        strip = self.pixmap(video_path, stat)
+        if strip is None:
+            return None
+        w, h = self.tile
+        i = min(self.frames - 1, max(0, int(fraction * self.frames)))
+        return strip.copy(i * w, 0, w, h)
+
+    def prune(self, video_paths, stats=None):
+        """Delete the strips of videos that are gone or have changed; stats
+        maps paths to their (size, mtime) where already known."""
+        if not os.path.isdir(self.root):
+            return
+        stats = stats or {}
+        keep = {os.path.basename(p) for p in
+                (self.strip_path(v, stats.get(v)) for v in video_paths) if p}
+        for fn in os.listdir(self.root):
+            if fn not in keep and not fn.endswith(".tmp.jpg"):
+                try:
+                    os.remove(os.path.join(self.root, fn))
+                except OSError:
+                    pass
+
+class ThumbnailPixmapCache:
+    """Bounded in-memory cache of thumbnail pixmaps, keyed on path, size
+    and mtime, so showing the list again reads no thumbnail files."""
+
+    def __init__(self, limit=THUMBNAIL_CACHE_SIZE):
+        self.limit = limit
+        self._pixmaps = OrderedDict()
+
+    @staticmethod
+    def key(video_path, stat=None):
+        if stat is None:
+            stat = JsonIndex._stat(video_path)
+            if stat is None:
+                return None
+        return (os.path.abspath(video_path),) + tuple(stat)
+
+    def get(self, key, atlas):
+        """Return the thumbnail pixmap of the video a key() stands for, from
+        memory or the atlas, or None."""
+        if key is None:
+            return None
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        image = atlas.image(key[0], key[1:])
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self.limit:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        self._pixmaps.clear()
+
+class ThumbnailPool(QObject):
+    """Fills a thumbnail store (a ThumbnailAtlas or FilmstripCache) on a few
+    worker threads, most wanted first.
+
+    Requests are served in priority order (lower first), and asking again
+    for a queued video with a lower priority moves it up, so the rows on
+    screen can jump the queue. cancel() drops everything still queued;
+    while paused, workers finish their current thumbnail and then wait.
+    """
+    ready = pyqtSignal(str)          # emits video path, once the store has its image
+    error = pyqtSignal(str)          # emits error message
+
+    def __init__(self, store, workers=THUMBNAIL_WORKERS, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._cond = threading.Condition()
+        self._heap = []              # (priority, order, path)
+        self._queued = {}            # path -> priority of its live heap entry
+        self._order = 0
+        self._paused = False
+        self._running = True
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def request(self, video_paths, priority=0):
+        with self._cond:
+            for path in video_paths:
+                current = self._queued.get(path)
+                if current is not None and current <= priority:
+                    continue
+                # An older, lower-priority entry stays in the heap and is
+                # skipped when it comes up
+                self._queued[path] = priority
+                heapq.heappush(self._heap, (priority, self._order, path))
+                self._order += 1
+            self._cond.notify_all()
+
+    def cancel(self):
+        with self._cond:
+            self._heap = []
+            self._queued = {}
+
+    def set_paused(self, paused):
+        with self._cond:
+            self._paused = paused
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._heap = []
+            self._queued = {}
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _take(self):
+        with self._cond:
+            while True:
+                while self._running and (self._paused or not self._heap):
+                    self._cond.wait()
+                if not self._running:
+                    return None
+                priority, _, path = heapq.heappop(self._heap)
+                if self._queued.get(path) == priority:
+                    del self._queued[path]
+                    return path
+
+    def _work(self):
+        while True:
+            path = self._take()
+            if path is None:
+                return
+            try:
+                ok = self.store.generate(path)
+            except Exception as e:
+                self.error.emit(f"Error generating thumbnail for {path}: {e}")
+                continue
+            if ok:
+                self.ready.emit(path)
+
+class VideoLibraryModel(QAbstractListModel):
+    """The video library as a list model: one row per file, holding only
+    its path, name and (size, mtime) as listed. Thumbnails and the info
+    line are looked up when a row is painted, so only the rows on screen
+    cost anything, and neither stats the file again."""
+    InfoRole = Qt.UserRole + 1       # one-line summary under the name
+
+    def __init__(self, metadata, pixmaps, atlas, parent=None):
+        super().__init__(parent)
+        self.metadata = metadata
+        self.pixmaps = pixmaps
+        self.atlas = atlas
+        self._rows = []              # (path, name, (size, mtime))
+        self._row_of = {}            # path -> row
+        self._keys = []              # thumbnail pixmap key of each row
+        self._info = {}              # row -> info line, until refreshed
+        self._scrub = None           # (path, pixmap) shown instead of a thumbnail
+
+    def set_videos(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._row_of = {path: i for i, (path, _, _) in enumerate(self._rows)}
+        self._keys = [ThumbnailPixmapCache.key(path, stat) for path, _, stat in self._rows]
+        self._info = {}
+        self._scrub = None
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        row = index.row()
+        path, name, stat = self._rows[row]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.UserRole:
+            return path
+        if role == self.InfoRole:
+            info = self._info.get(row)
+            if info is None:
+                info = self._info[row] = format_video_info(stat[0], self.metadata.get(path, stat))
+            return info
+        if role == Qt.DecorationRole:
+            if self._scrub and self._scrub[0] == path:
+                return self._scrub[1]
+            return self.pixmaps.get(self._keys[row], self.atlas)
+        return None
+
+    def path(self, row):
+        return self._rows[row][0]
+
+    def stat(self, row):
+        """Return a video's (size, mtime) as it was listed."""
+        return self._rows[row][2]
+
+    def paths(self):
+        return [path for path, _, _ in self._rows]
+
+    def stats(self):
+        """Return {path: (size, mtime)} of every video, in row order."""
+        return {path: stat for path, _, stat in self._rows}
+
+    def row_of(self, path):
+        return self._row_of.get(path, -1)
+
+    def refresh(self, path):
+        """Repaint a video's row, e.g. once its thumbnail or metadata is in."""
+        row = self._row_of.get(path)
+        if row is not None:
+            self._info.pop(row, None)
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def set_scrub(self, path, pixmap):
+        """Show pixmap in place of a video's thumbnail (None puts it back)."""
+        previous = self._scrub[0] if self._scrub else None
+        self._scrub = (path, pixmap) if path and pixmap is not None else None
+        if previous and previous != path:
+            self.refresh(previous)
+        if path:
+            self.refresh(path)
+
+class VideoItemDelegate(QStyledItemDelegate):
+    """Paints a video library row: thumbnail (or a play icon until it is
+    made), the info line and the file name. Rows are all the same height."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.play_icon = QApplication.style().standardIcon(QStyle.SP_MediaPlay).pixmap(24, 24)
+
+    def sizeHint(self, option, index):
+        return QSize(THUMBNAIL_SIZE[0] * 2, VIDEO_ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        # 1) row background from the list's style sheet (selected, hover)
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        rect = option.rect.adjusted(12, 0, -12, 0)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # 2) thumbnail, or a placeholder until the thumbnail pool has it
+        w, h = THUMBNAIL_SIZE
+        thumb = QRect(rect.left(), rect.top() + (rect.height() - h) // 2, w, h)
+        pixmap = index.data(Qt.DecorationRole)
+        painter.setPen(QColor("#e0e0e0"))
+        painter.setBrush(QColor("#f0f0f0"))
+        painter.drawRoundedRect(thumb, 4, 4)
+        if pixmap is not None:
+            painter.drawPixmap(thumb, pixmap)
+        else:
+            icon = self.play_icon.rect()
+            icon.moveCenter(thumb.center())
+            painter.drawPixmap(icon, self.play_icon)
+
+        # 3) info line, then the file name wrapped below it
+        text = QRect(thumb.right() + 20, thumb.top(), rect.right() - thumb.right() - 20, h)
+        font = QFont(option.font)
+        font.setPixelSize(11)
+        painter.setFont(font)
+        painter.setPen(QColor("#6c757d"))
+        info_height = QFontMetrics(font).height()
+        painter.drawText(text, Qt.AlignLeft | Qt.AlignTop, index.data(VideoLibraryModel.InfoRole) or "")
+        font.setPixelSize(13)
+        font.setWeight(QFont.Medium)
+        painter.setFont(font)
+        painter.setPen(QColor("#212529"))
+        painter.drawText(text.adjusted(0, info_height + 4, 0, 0),
+                         Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, index.data(Qt.DisplayRole))
+        painter.restore()
+
+class LoopCache:
+    """On-disk cache of fully decoded short clips, stored as numpy memmaps.
+
+    An entry holds every frame of a clip already scaled and converted for
+    one output size, keyed on the file path, its mtime and that size. Least
+    recently used entries are evicted to keep the cache under its quota,
+    together with the FirstFrameCache files kept below the same directory.
+    """
+    FORMAT = "bgr24" if FRAME_IS_BGR else "rgb24"
+
+    def __init__(self, root, clip_budget_mb=1024, quota_mb=8192):
+        self.root = root
+        self._lock = threading.Lock()
+        self._building = set()
+        self.set_limits(clip_budget_mb, quota_mb)
+
+    def set_limits(self, clip_budget_mb, quota_mb):
+        self.clip_budget = int(clip_budget_mb) * 1024 * 1024
+        self.quota = int(quota_mb) * 1024 * 1024
+
+    def key(self, path, size, mode, loop=(0, 0)):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        raw = (f"{os.path.abspath(path)}|{mtime}|{size[0]}x{size[1]}|{mode}"
+               f"|{loop[0]}-{loop[1]}|{self.FORMAT}")
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        return (os.path.join(self.root, f"{key}.frames"),
+                os.path.join(self.root, f"{key}.json"))
+
+    def open(self, key):
+        """Return (frames, fps) for a complete entry, or None."""
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            shape = (meta['frames'], meta['height'], meta['width'], 3)
+            frames = np.memmap(data_path, dtype=np.uint8, mode='r', shape=shape)
+            # Mark the entry as recently used
+            os.utime(data_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return frames, meta['fps']
+
+    def create(self, key, count, frame_shape):
+        """Start a new entry for count frames; returns a writable memmap,
+        or None when the clip does not fit the budget."""
+        h, w = frame_shape[:2]
+        nbytes = count * h * w * 3
+        if count <= 0 or nbytes > self.clip_budget or nbytes > self.quota:
+            return None
+        with self._lock:
+            if key in self._building:
+                return None
+            self._building.add(key)
+            os.makedirs(self.root, exist_ok=True)
+            self._evict(self.quota - nbytes)
+        try:
+            return np.memmap(self._paths(key)[0], dtype=np.uint8, mode='w+', shape=(count, h, w, 3))
+        except OSError as e:
+            print(f"Could not create loop cache entry: {e}")
+            self.abort(key)
+            return None
+
+    def commit(self, key, frames, count, fps):
+        """Finish an entry after count frames were written."""
+        frames.flush()
+        meta = {
+            'frames': count,
+            'height': frames.shape[1],
+            'width': frames.shape[2],
+            'fps': fps,
+            'format': self.FORMAT
+        }
+        with open(self._paths(key)[1], 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        with self._lock:
+            self._building.discard(key)
+
+    def abort(self, key):
+        """Drop an unfinished entry; the caller must release its memmap first."""
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._building.discard(key)
+
+    def make_room(self, nbytes):
+        """Evict entries so that nbytes more fit under the quota."""
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            self._evict(self.quota - nbytes)
+
+    def _evict(self, limit):
+        """Delete least recently used entries until at most limit bytes remain."""
+        entries = []                     # (mtime, size, key, files)
+        for folder, _, names in os.walk(self.root):
+            for fn in names:
+                path = os.path.join(folder, fn)
+                if fn.endswith('.frames'):
+                    key = fn[:-len('.frames')]
+                    files = self._paths(key)
+                elif fn.endswith('.npy') and not fn.endswith('.tmp.npy'):
+                    key, files = None, (path,)       # a first frame
+                else:
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, key, files))
+        total = sum(entry[1] for entry in entries)
+        for _, size, key, files in sorted(entries, key=lambda entry: entry[0]):
+            if total <= limit:
+                break
+            if key in self._building:
+                continue
+            try:
+                for path in files:
+                    if os.path.exists(path):
+                        os.remove(path)
+            except OSError:
+                continue        # still mapped by a decoder on Windows
+            total -= size
+
+class FirstFrameCache:
+    """First frame of each video as the presenter shows it, so a switch can
+    show the right image before its decoder has produced a frame.
+
+    Frames are saved raw (.npy) at the output size and scale mode they
+    were prepared for: loading one is a single read, with nothing to decode
+    or resize on the GUI thread. root is expected below the loop cache,
+    whose quota and least-recently-used order the frames share.
+    """
+
+    def __init__(self, root, loop_cache=None):
+        self.root = root
+        self.loop_cache = loop_cache
+
+    def _file(self, path, loop_in, size, mode):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(path)}|{mtime}|{loop_in}|{size[0]}x{size[1]}|{mode}"
+        return os.path.join(self.root, hashlib.sha1(raw.encode('utf-8')).hexdigest() + ".npy")
+
+    def load(self, path, loop_in, size, mode):
+        """Return the cached first frame of a video, ready for display, or None."""
+        fn = self._file(path, loop_in, size, mode)
+        if fn is None or not os.path.exists(fn):
+            return None
+        try:
+            pixels = np.load(fn)
+            # Mark the frame as recently used
+            os.utime(fn)
+        except (OSError, ValueError):
+            return None
+        return pixels
+
+    def store(self, path, loop_in, size, mode, pixels):
+        fn = self._file(path, loop_in, size, mode)
+        if fn is None or os.path.exists(fn):
+            return
+        tmp = fn[:-len(".npy")] + ".tmp.npy"
+        try:
+            if self.loop_cache is not None:
+                self.loop_cache.make_room(pixels.nbytes)
+            os.makedirs(self.root, exist_ok=True)
+            np.save(tmp, pixels)
+            os.replace(tmp, fn)
+        except OSError as e:
+            print(f"Could not save first frame: {e}")
+
+class PlaybackClock:
+    """Monotonic clock that presentation timestamps are scheduled against."""
+
+    def __init__(self):
+        self._origin = None
+        self.next_due = 0.0              # clock time the next frame is due
+
+    @property
+    def running(self):
+        return self._origin is not None
+
+    def reset(self):
+        self._origin = None
+        self.next_due = 0.0
+
+    def start_at(self, pts):
+        """Start the clock so that it reads pts right now."""
+        self._origin = time.monotonic() - pts
+
+    def now(self):
+        return time.monotonic() - self._origin
+
+class VideoDecoder(QThread):
+    """Decodes a background video off the GUI thread.
+
+    Frames are converted and scaled here and kept in a small ring buffer,
+    so the presenter only has to pick up a ready frame on each tick. The
+    clip loops between optional in/out points; a second capture is pre-rolled
+    to the loop start before the out point so the wrap is frame-exact.
+    """
+    opened   = pyqtSignal(float)     # emits the video's frame rate
+    ready    = pyqtSignal()          # emitted once the buffer first fills
+    underrun = pyqtSignal(int)       # emits total number of underruns
+    error    = pyqtSignal(str)       # emits error message
+
+    def __init__(self, path, depth=3, parent=None, loop_cache=None,
+                 keyframe_index=None, loop_range=(0.0, 0.0), first_frames=None,
+                 frame_pool=None):
+        super().__init__(parent)
+        self.path = path
+        self.depth = max(1, int(depth))
+        self.loop_cache = loop_cache
+        self.keyframe_index = keyframe_index
+        self.first_frames = first_frames
+        self.frame_pool = frame_pool or FramePool()
+        # In/out points in seconds; an out point of 0 means the end of the clip
+        self.loop_in, self.loop_out = loop_range
+        self.fps = 25.0
+        self.frame_count = 0
+        self.underruns = 0
+        self._frames = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self._starved = True             # no underrun until the first frame
+        self._ready_sent = False
+        self._target_size = (0, 0)
+        self._extra_sizes = ()           # other outputs' sizes, see set_extra_sizes
+        self._scale_mode = "fill"
+
+    def set_depth(self, depth):
+        with self._cond:
+            self.depth = max(1, int(depth))
+            while len(self._frames) > self.depth:
+                self._recycle(self._frames.popleft())
+            self._cond.notify_all()
+
+    def set_target_size(self, width, height):
+        """Set the size frames are scaled to; buffered frames are dropped."""
+        with self._cond:
+            if (width, height) == self._target_size:
+                return
+            self._target_size = (width, height)
+            self._clear_frames()
+            self._cond.notify_all()
+
+    def set_extra_sizes(self, sizes):
+        """Set further output sizes each frame is also scaled to.
+
+        Buffered items are (pts, frame, extras) with extras mapping each of
+        these sizes to its own copy of the frame, scaled once per size from
+        the primary frame however many windows show it.
+        """
+        with self._cond:
+            self._extra_sizes = tuple(sorted(set(sizes)))
+
+    def set_scale_mode(self, mode):
+        """Set how frames are fitted to the target size (see scale_frame)."""
+        if mode not in VIDEO_SCALE_MODES:
+            mode = "fill"
+        with self._cond:
+            if mode == self._scale_mode:
+                return
+            self._scale_mode = mode
+            self._clear_frames()
+            self._cond.notify_all()
+
+    def _clear_frames(self):
+        while self._frames:
+            self._recycle(self._frames.popleft())
+
+    def _recycle(self, item):
+        # Hand a buffered frame that will not be shown back to the pool
+        self.frame_pool.put(item[1])
+        for pixels in item[2].values():
+            self.frame_pool.put(pixels)
+
+    def is_ready(self):
+        """Whether the buffer has filled at least once (ready was emitted)."""
+        return self._ready_sent
+
+    def _check_starved(self):
+        # Count each time the buffer runs dry as one underrun
+        if not self._frames:
+            if not self._starved:
+                self._starved = True
+                self.underruns += 1
+                self.underrun.emit(self.underruns)
+        else:
+            self._starved = False
+
+    def take_frame(self):
+        """Return the next ready (pts, frame, extras), or None if the buffer ran dry.
+
+        The frame is in FRAME_IMAGE_FORMAT order; give it back to frame_pool
+        once it is no longer shown.
+        """
+        with self._cond:
+            self._check_starved()
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._cond.notify_all()
+            return frame
+
+    def take_due(self, now):
+        """Return (frame, dropped) for playback clock time now.
+
+        frame is the newest buffered (pts, frame, extras) that is due, or None if
+        none is due yet; dropped counts the older due frames skipped over.
+        """
+        with self._cond:
+            self._check_starved()
+            frame = None
+            dropped = 0
+            while self._frames and self._frames[0][0] <= now:
+                if frame is not None:
+                    dropped += 1
+                    self._recycle(frame)
+                frame = self._frames.popleft()
+            if frame is not None:
+                self._cond.notify_all()
+            return frame, dropped
+
+    def stop(self):
+        """Stop decoding and give the frames still buffered back to the pool."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self.wait()
+        with self._cond:
+            self._clear_frames()
+
+    def _prepare(self, frame, size, mode):
+        return prepare_frame(frame, size[0], size[1], mode, self.frame_pool)
+
+    def _open_cached(self, size, mode, loop):
+        """Return the cached frames of the loop for an output, or None."""
+        if self.loop_cache is None:
+            return None
+        key = self.loop_cache.key(self.path, size, mode, loop)
+        entry = self.loop_cache.open(key) if key else None
+        return entry[0] if entry else None
+
+    def _start_build(self, size, mode, loop, count, frame_shape):
+        """Start recording the loop into the loop cache, if it fits."""
+        if self.loop_cache is None:
+            return None
+        key = self.loop_cache.key(self.path, size, mode, loop)
+        frames = self.loop_cache.create(key, count, frame_shape) if key else None
+        return (key, frames) if frames is not None else None
+
+    def _seek(self, cap, target, keyframes):
+        """Position cap so its next read returns frame target exactly."""
+        key = keyframe_before(keyframes, target)
+        cap.set(cv2.CAP_PROP_POS_FRAMES, key)
+        for _ in range(target - key):
+            if not cap.grab():
+                break
+
+    def run(self):
+        cap = cv2.VideoCapture(self.path)
+        if not cap.isOpened():
+            self.error.emit(f"Could not open video: {self.path}")
+            return
+        self.fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        self.frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        keyframes = self.keyframe_index.get(self.path) if self.keyframe_index else [0]
+
+        # Loop points in frames; end is None until the clip's length is known
+        start = max(0, round(self.loop_in * self.fps))
+        end = self.frame_count or None
+        if self.loop_out > 0:
+            end = round(self.loop_out * self.fps) if end is None else min(end, round(self.loop_out * self.fps))
+        if end is not None and end <= start:
+            start, end = 0, self.frame_count or None
+        loop = (start, end or 0)
+        head_len = max(self.depth, LOOP_PREBUFFER_FRAMES)
+
+        pos = start          # index of the next frame within the file
+        emitted = 0          # frames produced so far, for timestamps
+        cap_pos = 0          # index of the next frame cap.read() returns
+        output = None        # (size, mode) the cache state below belongs to
+        cached = None        # every frame of the loop, once it is cached
+        build = None         # (key, memmap) while the first loop is recorded
+        no_cache = set()     # outputs whose loop does not fit the cache
+        spare = None         # second capture, pre-rolled to the loop start
+        spare_pos = None     # its next frame, or None while it is idle
+        read_buf = None      # arrays the captures decode into, reused
+        spare_buf = None
+        head = []            # first frames of the loop, prebuffered from spare
+        serving = False      # playing back head right after a wrap
+        try:
+            with self._cond:
+                output = (self._target_size, self._scale_mode)
+            cached = self._open_cached(output[0], output[1], loop)
+            if cached is None and end is not None and end - start > head_len:
+                spare = cv2.VideoCapture(self.path)
+                if not spare.isOpened():
+                    spare.release()
+                    spare = None
+            self.opened.emit(self.fps)
+
+            while True:
+                # Wait for a free slot in the ring buffer
+                with self._cond:
+                    while self._running and len(self._frames) >= self.depth:
+                        self._cond.wait()
+                    if not self._running:
+                        break
+                    size = self._target_size
+                    mode = self._scale_mode
+                    extra_sizes = self._extra_sizes
+
+                if (size, mode) != output:
+                    # New output size: a half-recorded entry and the
+                    # prebuffered head are useless now
+                    if build is not None:
+                        key, build = build[0], None
+                        self.loop_cache.abort(key)
+                    if serving:
+                        serving = False
+                        cap_pos = -1
+                    head, spare_pos = [], None
+                    output = (size, mode)
+                    cached = self._open_cached(size, mode, loop)
+
+                pixels = None
+                wrap = False
+                if cached is not None:
+                    # Steady state for short clips: no decoding at all
+                    if pos - start >= len(cached):
+                        pos = start
+                    pixels = cached[pos - start]
+                    pos += 1
+                else:
+                    if serving:
+                        pixels = head[pos - start]
+                    else:
+                        if cap_pos != pos:
+                            self._seek(cap, pos, keyframes)
+                            cap_pos = pos
+                        ret, frame = cap.read(read_buf)
+                        if not ret:
+                            if pos == start:
+                                self.error.emit(f"Could not read video: {self.path}")
+                                break
+                            # The container over-reported its length
+                            end = pos
+                            wrap = True
+                        else:
+                            read_buf = frame
+                            cap_pos += 1
+                            pixels = self._prepare(frame, size, mode)
+                            if pos == start and self.first_frames is not None:
+                                self.first_frames.store(self.path, self.loop_in, size, mode, pixels)
+
+                    if not wrap:
+                        if pos == start and build is None and output not in no_cache:
+                            count = (end or self.frame_count) - start
+                            build = self._start_build(size, mode, loop, count, pixels.shape)
+                            if build is None:
+                                no_cache.add(output)
+                        if build is not None:
+                            if pos - start < len(build[1]):
+                                build[1][pos - start] = pixels
+                            else:
+                                # The container under-reported its length
+                                key, build = build[0], None
+                                self.loop_cache.abort(key)
+                                no_cache.add(output)
+                        pos += 1
+                        if serving and pos - start == len(head):
+                            serving, head = False, []
+                        wrap = end is not None and pos >= end
+
+                    # Pre-roll the spare capture to the loop start, one step
+                    # per frame, and prebuffer the first frames before EOF
+                    if spare is not None and not serving and not wrap and end is not None:
+                        if spare_pos is None:
+                            lead = start - keyframe_before(keyframes, start) + head_len
+                            if pos >= end - lead - self.depth:
+                                spare_pos = keyframe_before(keyframes, start)
+                                spare.set(cv2.CAP_PROP_POS_FRAMES, spare_pos)
+                        elif spare_pos < start:
+                            spare.grab()
+                            spare_pos += 1
+                        elif len(head) < head_len:
+                            ret, frame = spare.read(spare_buf)
+                            if ret:
+                                spare_buf = frame
+                                head.append(self._prepare(frame, size, mode))
+                                spare_pos += 1
+
+                if wrap:
+                    pos = start
+                    if build is not None:
+                        # First loop recorded: play it from the cache from now on
+                        key, frames = build
+                        build = None
+                        self.loop_cache.commit(key, frames, end - start, self.fps)
+                        del frames
+                        cached = self._open_cached(size, mode, loop)
+                        if cached is not None and spare is not None:
+                            spare.release()
+                            spare = None
+                    if cached is None and spare is not None and len(head) == head_len:
+                        # Continue on the pre-rolled capture after the head
+                        cap, spare = spare, cap
+                        read_buf, spare_buf = spare_buf, read_buf
+                        cap_pos = start + head_len
+                        spare_pos = None
+                        serving = True
+                    else:
+                        head, spare_pos = [], None
+                if pixels is None:
+                    continue
+
+                # Timestamps keep counting across loops, so the clock
+                # never has to jump back
+                pts = emitted / self.fps
+                emitted += 1
+                extras = {}
+                for w, h in extra_sizes:
+                    shape = scaled_size(pixels.shape[1], pixels.shape[0], w, h, mode)
+                    dst = self.frame_pool.get((shape[1], shape[0], 3))
+                    extras[(w, h)] = scale_frame(pixels, w, h, mode, dst=dst)
+                with self._cond:
+                    # Drop frames scaled for a size that is no longer wanted
+                    if size == self._target_size and mode == self._scale_mode:
+                        self._frames.append((pts, pixels, extras))
+                    else:
+                        self._recycle((pts, pixels, extras))
+                    filled = len(self._frames) >= self.depth
+                if filled and not self._ready_sent:
+                    self._ready_sent = True
+                    self.ready.emit()
+        except Exception as e:
+            self.error.emit(f"{e}")
+        finally:
+            cap.release()
+            if spare is not None:
+                spare.release()
+            if build is not None:
+                key, build = build[0], None
+                self.loop_cache.abort(key)
+
+class DecoderPool:
+    """Recently used decoders, kept open and parked where they stopped.
+
+    A parked decoder idles once its ring buffer is full, so it holds its
+    file handles and a few frames but uses no CPU. Switching back to its
+    video skips the open and probe, and frames are ready at once.
+    """
+
+    def __init__(self, capacity=3):
+        self._decoders = OrderedDict()
+        self.set_capacity(capacity)
+
+    @staticmethod
+    def key(path, loop_range):
+        return (os.path.abspath(path), float(loop_range[0]), float(loop_range[1]))
+
+    def set_capacity(self, capacity):
+        self.capacity = max(0, int(capacity))
+        self._trim()
+
+    def take(self, key):
+        """Remove and return the parked decoder for key, or None."""
+        decoder = self._decoders.pop(key, None)
+        if decoder is not None and decoder.isFinished():
+            self.close(decoder)
+            return None
+        return decoder
+
+    def park(self, decoder):
+        """Keep a decoder that is no longer shown, evicting the oldest."""
+        key = self.key(decoder.path, (decoder.loop_in, decoder.loop_out))
+        old = self._decoders.pop(key, None)
+        if old is not None and old is not decoder:
+            self.close(old)
+        if decoder.isFinished():
+            # Stopped on an error; it cannot be resumed
+            self.close(decoder)
+            return
+        self._decoders[key] = decoder
+        self._trim()
+
+    def clear(self):
+        while self._decoders:
+            self.close(self._decoders.popitem()[1])
+
+    def _trim(self):
+        while len(self._decoders) > self.capacity:
+            self.close(self._decoders.popitem(last=False)[1])
+
+    @staticmethod
+    def close(decoder):
+        decoder.stop()
+        decoder.deleteLater()
+
+def proxy_path(video_path, tier):
+    """Return where the proxy of a video for a given tier is stored.
+
+    The name carries a hash of the video's full path, so videos with the
+    same name in different folders get separate proxies.
+    """
+    base = os.path.splitext(os.path.basename(video_path))[0]
+    digest = hashlib.sha1(os.path.abspath(video_path).encode('utf-8')).hexdigest()[:10]
+    return os.path.join(PROXY_DIR, f"{base}.{digest}.{tier}.mp4")
+
+class ProxyIndex(JsonIndex):
+    """The proxies written for each video, with their actual size.
+
+    An entry only holds while the source video is unchanged, so a video
+    that is replaced or edited falls back to the original until its
+    proxies are rebuilt.
+    """
+
+    def __init__(self, path=PROXY_INDEX_FILE):
+        super().__init__(path, "proxy index")
+
+    def proxies(self, video_path):
+        """Return {tier: (width, height)} of a video's current proxies."""
+        entry = self.lookup(video_path)
+        return {tier: tuple(size) for tier, size in entry['proxies'].items()} if entry else {}
+
+    def add(self, video_path, tier, width, height):
+        proxies = self.proxies(video_path)
+        proxies[tier] = (width, height)
+        self.store(video_path, proxies=proxies)
+
+    def find(self, video_path, width, height):
+        """Return the smallest proxy covering a width x height output.
+
+        Falls back to the original file when no proxy is large enough.
+        """
+        sizes = sorted(self.proxies(video_path).items(), key=lambda item: item[1][0] * item[1][1])
+        for tier, (w, h) in sizes:
+            path = proxy_path(video_path, tier)
+            if w >= width and h >= height and os.path.exists(path):
+                return path
+        return video_path
+
+class ProxyTranscodeThread(QThread):
+    """Writes reduced, loop-friendly proxies of the videos in VIDEOS_DIR.
+
+    Proxies are capped in size and frame rate and use short keyframe
+    intervals so they decode and seek cheaply. ffmpeg is used when it is
+    installed, otherwise OpenCV's own writer.
+    """
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)       # emits number of proxies written
+    error    = pyqtSignal(str)       # emits error message
+
+    def __init__(self, video_paths, parent=None):
+        super().__init__(parent)
+        self.video_paths = list(video_paths)
+        self.index = ProxyIndex()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        os.makedirs(PROXY_DIR, exist_ok=True)
+        self._prune()
+        jobs = []
+        for path in self.video_paths:
+            # Only tiers with no proxy made from the video as it is now
+            done = self.index.proxies(path)
+            for tier, max_w, max_h, max_fps in PROXY_TIERS:
+                out = proxy_path(path, tier)
+                if tier not in done or not os.path.exists(out):
+                    jobs.append((path, tier, out, max_w, max_h, max_fps))
+        written = 0
+        for i, (path, tier, out, max_w, max_h, max_fps) in enumerate(jobs):
+            if self._cancelled:
+                break
+            tmp = out[:-len(".mp4")] + ".tmp.mp4"
+            try:
+                if shutil.which("ffmpeg"):
+                    ok = self._transcode_ffmpeg(path, tmp, max_w, max_h, max_fps)
+                else:
+                    ok = self._transcode_cv2(path, tmp, max_w, max_h, max_fps)
+                if ok:
+                    os.replace(tmp, out)
+                    # Record the size actually written, which the source's
+                    # aspect ratio and resolution decide, not the tier
+                    cap = cv2.VideoCapture(out)
+                    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+                    cap.release()
+                    self.index.add(path, tier, *size)
+                    written += 1
+            except Exception as e:
+                self.error.emit(f"Proxy for {os.path.basename(path)} failed: {e}")
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            self.progress.emit(int((i + 1) / len(jobs) * 100))
+        self.progress.emit(100)
+        self.finished.emit(written)
+
+    def _prune(self):
+        """Remove proxies whose source video no longer exists."""
+        self.index.prune(self.video_paths)
+        wanted = {os.path.basename(proxy_path(p, tier))
+                  for p in self.video_paths for tier, *_ in PROXY_TIERS}
+        wanted.add(os.path.basename(PROXY_INDEX_FILE))
+        for fn in os.listdir(PROXY_DIR):
+            if fn not in wanted:
+                try:
+                    os.remove(os.path.join(PROXY_DIR, fn))
+                except OSError:
+                    pass
+
+    def _transcode_ffmpeg(self, src, dst, max_w, max_h, max_fps):
+        cap = cv2.VideoCapture(src)
+        src_fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        cap.release()
+        cmd = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-i", src,
+            "-an",
+            "-vf", (f"scale='min({max_w},iw)':'min({max_h},ih)'"
+                    f":force_original_aspect_ratio=decrease:force_divisible_by=2,"
+                    f"fps={min(src_fps, max_fps):.3f}"),
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
+            "-g", str(PROXY_KEYFRAME_INTERVAL),
+            "-keyint_min", str(PROXY_KEYFRAME_INTERVAL),
+            "-sc_threshold", "0",
+            "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart",
+            dst,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "ffmpeg failed")
+        return True
+
+    def _transcode_cv2(self, src, dst, max_w, max_h, max_fps):
+        cap = cv2.VideoCapture(src)
+        if not cap.isOpened():
+            raise RuntimeError("could not open video")
+        writer = None
+        try:
+            src_fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+            out_fps = min(src_fps, max_fps)
+            w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            scale = min(1.0, max_w / w, max_h / h)
+            size = (max(2, int(w * scale) // 2 * 2), max(2, int(h * scale) // 2 * 2))
+            # OpenCV's MPEG-4 writer emits a keyframe every 12 frames
+            writer = cv2.VideoWriter(dst, cv2.VideoWriter_fourcc(*"mp4v"), out_fps, size)
+            if not writer.isOpened():
+                raise RuntimeError("could not create proxy writer")
+            src_index = 0
+            out_index = 0
+            while not self._cancelled:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                # Drop source frames to cap the frame rate
+                if src_index * out_fps >= out_index * src_fps:
+                    writer.write(scale_frame(frame, size[0], size[1], "fill"))
+                    out_index += 1
+                src_index += 1
+            return not self._cancelled and out_index > 0
+        finally:
+            cap.release()
+            if writer is not None:
+                writer.release()
+
 class SettingsDialog(QDialog):
     def __init__(self, parent=None, settings=None):
         super().__init__(parent)
@@ -255,7 +2045,7 @@ class SettingsDialog(QDialog):
         self.font_size_spin = QSpinBox()
         self.font_size_spin.setRange(10, 200)
         self.font_size_spin.setValue(self.settings['font_size'])
-        self.font_size_spin.setSuffix(' px')
+        self.font_size_spin.setSuffix(' pt')
         
         # Font Color
         color_layout = QHBoxLayout()
@@ -268,6 +2058,33 @@ class SettingsDialog(QDialog):
         color_layout.addWidget(self.color_edit, 1)
         color_layout.addWidget(color_btn)
         
+        # Outline, shadow and glow behind the text
+        self.outline_spin = QSpinBox()
+        self.outline_spin.setRange(0, 20)
+        self.outline_spin.setSpecialValueText("Off")
+        self.outline_spin.setSuffix(' px')
+        self.outline_spin.setValue(self.settings.get('text_outline_width', 0))
+        self.shadow_spin = QSpinBox()
+        self.shadow_spin.setRange(0, 40)
+        self.shadow_spin.setSpecialValueText("Off")
+        self.shadow_spin.setSuffix(' px')
+        self.shadow_spin.setValue(self.settings.get('text_shadow_size', 0))
+        self.glow_spin = QSpinBox()
+        self.glow_spin.setRange(0, 40)
+        self.glow_spin.setSpecialValueText("Off")
+        self.glow_spin.setSuffix(' px')
+        self.glow_spin.setValue(self.settings.get('text_glow_size', 0))
+        effect_color = self.settings.get('text_effect_color', '#000000')
+        effect_color_layout = QHBoxLayout()
+        self.effect_color_edit = QLineEdit(effect_color)
+        self.effect_color_edit.setReadOnly(True)
+        self.effect_color_edit.setStyleSheet(f"background-color: {effect_color};")
+        effect_color_btn = QPushButton("Choose...")
+        effect_color_btn.setObjectName("colorButton")
+        effect_color_btn.clicked.connect(self.choose_effect_color)
+        effect_color_layout.addWidget(self.effect_color_edit, 1)
+        effect_color_layout.addWidget(effect_color_btn)
+        
         # Italic Checkbox
         self.italic_cb = QCheckBox()
         self.italic_cb.setChecked(self.settings['italic'])
@@ -276,12 +2093,36 @@ class SettingsDialog(QDialog):
         self.show_next_line_cb = QCheckBox("")
         self.show_next_line_cb.setChecked(self.settings['show_next_line'])
         
+        # Auto-fit font size per slide
+        self.auto_fit_cb = QCheckBox()
+        self.auto_fit_cb.setChecked(self.settings.get('auto_fit_font', False))
+        self.auto_fit_max_spin = QSpinBox()
+        self.auto_fit_max_spin.setRange(AUTO_FIT_MIN_SIZE, 400)
+        self.auto_fit_max_spin.setValue(self.settings.get('auto_fit_max_size', 120))
+        self.auto_fit_max_spin.setSuffix(' pt')
+        self.auto_fit_max_spin.setEnabled(self.auto_fit_cb.isChecked())
+        self.auto_fit_cb.toggled.connect(self.auto_fit_max_spin.setEnabled)
+        
         # Fade duration
         self.fade_duration = QDoubleSpinBox()
         self.fade_duration.setRange(0.1, 5.0)
         self.fade_duration.setSingleStep(0.1)
         self.fade_duration.setValue(self.settings.get('fade_duration', 0.5))
         
+        self.lyric_transition_combo = QComboBox()
+        self.lyric_transition_combo.addItem("Fade out, then in", "fade")
+        self.lyric_transition_combo.addItem("Crossfade", "crossfade")
+        self.lyric_transition_combo.addItem("Slide up", "slide")
+        self.lyric_transition_combo.addItem("Cut", "cut")
+        self.lyric_transition_combo.setCurrentIndex(
+            max(0, self.lyric_transition_combo.findData(self.settings.get('lyric_transition', 'crossfade'))))
+        
+        self.video_crossfade_spin = QDoubleSpinBox()
+        self.video_crossfade_spin.setRange(0.0, 5.0)
+        self.video_crossfade_spin.setSingleStep(0.1)
+        self.video_crossfade_spin.setSpecialValueText("Cut")
+        self.video_crossfade_spin.setValue(self.settings.get('video_crossfade_duration', 1.0))
+        
         # Margins
         self.margin_left = QSpinBox()
         self.margin_left.setRange(0, 300)
@@ -293,6 +2134,72 @@ class SettingsDialog(QDialog):
         self.margin_right.setValue(self.settings['margins'][2])
         self.margin_right.setSuffix(' px')
         
+        # Frame buffer depth
+        self.buffer_depth_spin = QSpinBox()
+        self.buffer_depth_spin.setRange(1, 30)
+        self.buffer_depth_spin.setValue(self.settings.get('frame_buffer_depth', 3))
+        self.buffer_depth_spin.setSuffix(' frames')
+        
+        # Proxy videos
+        self.use_proxies_cb = QCheckBox()
+        self.use_proxies_cb.setChecked(self.settings.get('use_proxies', True))
+        
+        # Loop cache limits
+        self.loop_cache_clip_spin = QSpinBox()
+        self.loop_cache_clip_spin.setRange(0, 16384)
+        self.loop_cache_clip_spin.setSingleStep(256)
+        self.loop_cache_clip_spin.setValue(self.settings.get('loop_cache_clip_mb', 1024))
+        self.loop_cache_clip_spin.setSuffix(' MB')
+        self.loop_cache_clip_spin.setSpecialValueText("Off")
+        
+        self.loop_cache_quota_spin = QSpinBox()
+        self.loop_cache_quota_spin.setRange(0, 262144)
+        self.loop_cache_quota_spin.setSingleStep(1024)
+        self.loop_cache_quota_spin.setValue(self.settings.get('loop_cache_quota_mb', 8192))
+        self.loop_cache_quota_spin.setSuffix(' MB')
+        
+        self.decoder_pool_spin = QSpinBox()
+        self.decoder_pool_spin.setRange(0, 10)
+        self.decoder_pool_spin.setSpecialValueText("Off")
+        self.decoder_pool_spin.setValue(self.settings.get('decoder_pool_size', 3))
+        
+        # Video scaling
+        self.scale_mode_combo = QComboBox()
+        self.scale_mode_combo.addItem("Fit (letterbox)", "fit")
+        self.scale_mode_combo.addItem("Fill (stretch)", "fill")
+        self.scale_mode_combo.addItem("Crop to window", "crop")
+        self.scale_mode_combo.setCurrentIndex(
+            max(0, self.scale_mode_combo.findData(self.settings.get('video_scale_mode', 'fill'))))
+        
+        self.output_mode_combo = QComboBox()
+        self.output_mode_combo.addItem("Lyrics over video", "video")
+        self.output_mode_combo.addItem("Lyrics only, transparent", "transparent")
+        self.output_mode_combo.addItem("Lyrics only, key color", "key_color")
+        self.output_mode_combo.setCurrentIndex(
+            max(0, self.output_mode_combo.findData(self.settings.get('output_mode', 'video'))))
+        key_color = self.settings.get('key_color', '#00ff00')
+        key_color_layout = QHBoxLayout()
+        self.key_color_edit = QLineEdit(key_color)
+        self.key_color_edit.setReadOnly(True)
+        self.key_color_edit.setStyleSheet(f"background-color: {key_color};")
+        key_color_btn = QPushButton("Choose...")
+        key_color_btn.setObjectName("colorButton")
+        key_color_btn.clicked.connect(self.choose_key_color)
+        key_color_layout.addWidget(self.key_color_edit, 1)
+        key_color_layout.addWidget(key_color_btn)
+        
+        # Extra outputs: which ones are open and which layers each shows
+        self.output_rows = []
+        for config in self.settings.get('outputs', []):
+            row = QHBoxLayout()
+            boxes = {}
+            for key, label in (('enabled', "Show"), ('video', "Video"), ('next_line', "Next line")):
+                boxes[key] = QCheckBox(label)
+                boxes[key].setChecked(config.get(key, key != 'enabled'))
+                row.addWidget(boxes[key])
+            row.addStretch()
+            self.output_rows.append((config, row, boxes))
+        
         # Add rows to form
         # Add section headers as separate widgets
         text_header = QLabel("<b>Text Settings</b>")
@@ -300,15 +2207,23 @@ class SettingsDialog(QDialog):
         form_layout.addRow(text_header)
         
         form_layout.addRow("Font size:", self.font_size_spin)
+        form_layout.addRow("Fit text to screen:", self.auto_fit_cb)
+        form_layout.addRow("Largest fitted size:", self.auto_fit_max_spin)
         form_layout.addRow("Font color:", color_layout)
         form_layout.addRow("Italic text:", self.italic_cb)
+        form_layout.addRow("Text outline:", self.outline_spin)
+        form_layout.addRow("Text shadow:", self.shadow_spin)
+        form_layout.addRow("Text glow:", self.glow_spin)
+        form_layout.addRow("Effect color:", effect_color_layout)
         form_layout.addRow("Show Next Line:", self.show_next_line_cb)
         
         # Add animation section
         anim_header = QLabel("<b>Animation</b>")
         anim_header.setStyleSheet("font-size: 14px; color: #2c3e50; margin-top: 10px;")
         form_layout.addRow(anim_header)
+        form_layout.addRow("Lyric Transition:", self.lyric_transition_combo)
         form_layout.addRow("Lyric Fade Duration (seconds):", self.fade_duration)
+        form_layout.addRow("Video Crossfade (seconds):", self.video_crossfade_spin)
         
         # Add layout section
         layout_header = QLabel("<b>Layout</b>")
@@ -317,6 +2232,27 @@ class SettingsDialog(QDialog):
         form_layout.addRow("Left margin:", self.margin_left)
         form_layout.addRow("Right margin:", self.margin_right)
         
+        # Add video section
+        video_header = QLabel("<b>Video</b>")
+        video_header.setStyleSheet("font-size: 14px; color: #2c3e50; margin-top: 10px;")
+        form_layout.addRow(video_header)
+        form_layout.addRow("Output:", self.output_mode_combo)
+        form_layout.addRow("Key color:", key_color_layout)
+        form_layout.addRow("Frame buffer depth:", self.buffer_depth_spin)
+        form_layout.addRow("Video scaling:", self.scale_mode_combo)
+        form_layout.addRow("Use proxy videos:", self.use_proxies_cb)
+        form_layout.addRow("Loop cache per clip:", self.loop_cache_clip_spin)
+        form_layout.addRow("Loop cache disk quota:", self.loop_cache_quota_spin)
+        form_layout.addRow("Videos kept open:", self.decoder_pool_spin)
+        
+        # Add outputs section
+        if self.output_rows:
+            outputs_header = QLabel("<b>Outputs</b>")
+            outputs_header.setStyleSheet("font-size: 14px; color: #2c3e50; margin-top: 10px;")
+            form_layout.addRow(outputs_header)
+        for config, row, _ in self.output_rows:
+            form_layout.addRow(f"{config.get('name', 'Output')}:", row)
+        
         # Add form to container layout
         container_layout.addLayout(form_layout)
         container_layout.addStretch()  # Push content to top
@@ -397,15 +2333,943 @@ class SettingsDialog(QDialog):
             # Update preview
             self.color_edit.setStyleSheet(f"background-color: {color.name()};")
     
+    def choose_effect_color(self):
+        """Open color dialog to choose the outline, shadow and glow color"""
+        color = QColorDialog.getColor(QColor(self.effect_color_edit.text()), self, "Select Effect Color")
+        if color.isValid():
+            self.effect_color_edit.setText(color.name())
+            self.effect_color_edit.setStyleSheet(f"background-color: {color.name()};")
+    
+    def choose_key_color(self):
+        """Open color dialog to choose the lyrics-only background color"""
+        color = QColorDialog.getColor(QColor(self.key_color_edit.text()), self, "Select Key Color")
+        if color.isValid():
+            self.key_color_edit.setText(color.name())
+            self.key_color_edit.setStyleSheet(f"background-color: {color.name()};")
+    
     def get_values(self):
-        return {
+        # Start from the loaded settings so keys without a widget are kept
+        values = dict(self.settings)
+        values.update({
             "font_size": self.font_size_spin.value(),
             "font_color": self.color_edit.text(),
             "margins": [self.margin_left.value(), 0, self.margin_right.value(), 0],
             "italic": self.italic_cb.isChecked(),
+            "text_outline_width": self.outline_spin.value(),
+            "text_shadow_size": self.shadow_spin.value(),
+            "text_glow_size": self.glow_spin.value(),
+            "text_effect_color": self.effect_color_edit.text(),
             "fade_duration": self.fade_duration.value(),
-            "show_next_line": self.show_next_line_cb.isChecked()
-        }
+            "lyric_transition": self.lyric_transition_combo.currentData(),
+            "video_crossfade_duration": self.video_crossfade_spin.value(),
+            "show_next_line": self.show_next_line_cb.isChecked(),
+            "auto_fit_font": self.auto_fit_cb.isChecked(),
+            "auto_fit_max_size": self.auto_fit_max_spin.value(),
+            "frame_buffer_depth": self.buffer_depth_spin.value(),
+            "video_scale_mode": self.scale_mode_combo.currentData(),
+            "use_proxies": self.use_proxies_cb.isChecked(),
+            "output_mode": self.output_mode_combo.currentData(),
+            "key_color": self.key_color_edit.text(),
+            "loop_cache_clip_mb": self.loop_cache_clip_spin.value(),
+            "loop_cache_quota_mb": self.loop_cache_quota_spin.value(),
+            "decoder_pool_size": self.decoder_pool_spin.value(),
+            "outputs": [dict(config, **{key: box.isChecked() for key, box in boxes.items()})
+                        for config, _, boxes in self.output_rows]
+        })
+        return values
+
+class SplitLyricsDialog(QDialog):
+    """Paste a whole song and preview the slides it splits into.
+
+    The split is redone on every edit and font size change, for the slide
+    area of the presenter at its current size and margins.
+    """
+
+    def __init__(self, parent, settings, area):
+        super().__init__(parent)
+        self.setWindowTitle("Paste Song")
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.setMinimumSize(800, 500)
+        self.settings = settings
+        self.area = area
+        self.splitter = SlideSplitter()
+        self.fitter = FontFitter()
+        self.slides = []
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 15, 20, 15)
+        layout.setSpacing(10)
+        
+        # Song text on the left, resulting slides on the right
+        columns = QHBoxLayout()
+        self.text_edit = QTextEdit()
+        self.text_edit.setAcceptRichText(False)
+        self.text_edit.setPlaceholderText("Paste the song here.\n\nLeave a blank line between "
+                                          "stanzas. A line like [Chorus] starts a section.")
+        self.preview = QListWidget()
+        self.preview.setWordWrap(True)
+        self.preview.setAlternatingRowColors(True)
+        columns.addWidget(self.text_edit, 1)
+        columns.addWidget(self.preview, 1)
+        layout.addLayout(columns, 1)
+        
+        # Font size the slides must fit at
+        size_row = QHBoxLayout()
+        self.size_slider = QSlider(Qt.Horizontal)
+        self.size_slider.setRange(10, 200)
+        self.size_slider.setValue(settings['font_size'])
+        self.size_label = QLabel()
+        self.count_label = QLabel()
+        size_row.addWidget(QLabel("Font size:"))
+        size_row.addWidget(self.size_slider, 1)
+        size_row.addWidget(self.size_label)
+        size_row.addSpacing(20)
+        size_row.addWidget(self.count_label)
+        layout.addLayout(size_row)
+        
+        # Shown when a single line is too long for a slide on its own
+        self.overflow_label = QLabel()
+        self.overflow_label.setWordWrap(True)
+        self.overflow_label.setStyleSheet("color: #dc3545;")
+        self.overflow_label.hide()
+        layout.addWidget(self.overflow_label)
+        
+        self.replace_cb = QCheckBox("Replace the song's existing lines")
+        layout.addWidget(self.replace_cb)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        
+        self.text_edit.textChanged.connect(self.resplit)
+        self.size_slider.valueChanged.connect(self.resplit)
+        self.resplit()
+
+    def font_size(self):
+        return self.size_slider.value()
+
+    def resplit(self):
+        font = QFont()
+        font.setPointSize(self.font_size())
+        font.setItalic(self.settings['italic'])
+        self.slides = self.splitter.split(self.text_edit.toPlainText(), font,
+                                          self.area.width(), self.area.height())
+        
+        self.size_label.setText(f"{self.font_size()} pt")
+        self.count_label.setText(f"{len(self.slides)} slide(s)")
+        self.preview.clear()
+        overflowing = 0
+        for i, slide in enumerate(self.slides):
+            title = f"{i + 1}" + (f" – {slide['section']}" if slide['section'] else "")
+            item = QListWidgetItem(f"{title}\n{slide['text']}")
+            if self.overflows(slide['text'], font):
+                item.setForeground(QColor("#dc3545"))
+                overflowing += 1
+            self.preview.addItem(item)
+        if overflowing:
+            at = (f"even at {AUTO_FIT_MIN_SIZE} pt" if self.settings.get('auto_fit_font', False)
+                  else f"at {self.font_size()} pt")
+            self.overflow_label.setText(
+                f"{overflowing} slide(s) in red have a line that does not fit the screen {at}; "
+                f"it will be cut off. Shorten or break the line.")
+        self.overflow_label.setVisible(bool(overflowing))
+
+    def overflows(self, text, font):
+        """Whether a slide runs off the presenter: at the chosen size, or with
+        auto-fit on, even at the smallest size auto-fit goes down to."""
+        width, height = self.area.width(), self.area.height()
+        if self.settings.get('auto_fit_font', False):
+            return self.fitter.overflows(text, font, width, height, self.font_size())
+        return not self.splitter.fits(text.split('\n'), font, width, height)
+
+NO_TEXT_EFFECTS = (0, 0, 0, 0)
+
+def text_effects(settings):
+    """Return the text effects in settings as a hashable tuple:
+    (outline width, shadow size, glow size, effect color as rgba)."""
+    return (int(settings.get('text_outline_width', 0)),
+            int(settings.get('text_shadow_size', 0)),
+            int(settings.get('text_glow_size', 0)),
+            QColor(settings.get('text_effect_color', '#000000')).rgba())
+
+def alpha_layer(alpha, color, ratio=1.0):
+    """Return an image of a solid color shaped by an 8-bit alpha mask."""
+    h, w = alpha.shape
+    a = alpha.astype(np.uint16)
+    pixels = np.empty((h, w, 4), np.uint8)
+    # Premultiplied ARGB32 is stored B, G, R, A in memory
+    for i, channel in enumerate((color.blue(), color.green(), color.red())):
+        pixels[..., i] = a * channel // 255
+    pixels[..., 3] = alpha
+    image = QImage(pixels.data, w, h, 4 * w, QImage.Format_ARGB32_Premultiplied).copy()
+    image.setDevicePixelRatio(ratio)
+    return image
+
+class LyricRasterCache:
+    """Rendered text images, keyed on text, font, color, effects, layout and size.
+
+    Word wrap, layout, glyph rasterization and any outline, shadow or glow
+    happen once per key; painting a cached lyric is a single image blit, so
+    heavy effects cost nothing per video frame. Least recently used images
+    are dropped beyond the size limit.
+    """
+
+    def __init__(self, limit=LYRIC_CACHE_SIZE):
+        self.limit = limit
+        self._images = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text, font, color, flags, size, ratio=1.0, effects=NO_TEXT_EFFECTS):
+        return (text, font.key(), color.rgba(), int(flags), size.width(), size.height(), ratio, effects)
+
+    def contains(self, key):
+        return key in self._images
+
+    def get(self, text, font, color, flags, size, ratio=1.0, effects=NO_TEXT_EFFECTS):
+        """Return the image of text laid out in a box of size, rendering it on a miss."""
+        key = self.key(text, font, color, flags, size, ratio, effects)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+        self.misses += 1
+        image = self.render(text, font, color, flags, size, ratio, effects)
+        self._images[key] = image
+        while len(self._images) > self.limit:
+            self._images.popitem(last=False)
+        return image
+
+    @staticmethod
+    def render(text, font, color, flags, size, ratio=1.0, effects=NO_TEXT_EFFECTS):
+        image = QImage(max(1, int(size.width() * ratio)), max(1, int(size.height() * ratio)),
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setPen(color)
+        painter.setFont(font)
+        bounds = painter.drawText(QRect(QPoint(0, 0), size), flags, text)
+        painter.end()
+        
+        outline, shadow, glow, effect_rgba = effects
+        if not (outline or shadow or glow):
+            return image
+        # Leave room for glyphs that overhang their layout box
+        slack = QFontMetrics(font).height() // 4
+        return LyricRasterCache._apply_effects(image, bounds.adjusted(-slack, -slack, slack, slack),
+                                               outline, shadow, glow,
+                                               QColor.fromRgba(effect_rgba), ratio)
+
+    @staticmethod
+    def _apply_effects(image, bounds, outline, shadow, glow, color, ratio):
+        """Draw the effects under the text in image, within bounds (the text's
+        layout box) grown by how far the effects reach."""
+        # 1) Effects are built from the text's alpha mask, in device pixels,
+        #    and only over the part of the canvas they can touch
+        w, h = image.width(), image.height()
+        reach = max(round(outline * ratio) + 1,
+                    int(np.ceil(glow * ratio * 1.5)) + 1,
+                    round(shadow * ratio / 3) + int(np.ceil(shadow * ratio)) + 1)
+        x0 = max(0, int(bounds.left() * ratio) - reach)
+        y0 = max(0, int(bounds.top() * ratio) - reach)
+        x1 = min(w, int(np.ceil((bounds.right() + 1) * ratio)) + reach)
+        y1 = min(h, int(np.ceil((bounds.bottom() + 1) * ratio)) + reach)
+        if x1 <= x0 or y1 <= y0:
+            return image
+        bits = image.constBits()
+        bits.setsize(image.byteCount())
+        pixels = np.frombuffer(bits, np.uint8).reshape(h, image.bytesPerLine() // 4, 4)
+        alpha = pixels[y0:y1, x0:x1, 3].copy()
+        
+        layers = []
+        # 2) Glow: a wide, brightened blur around the glyphs
+        if glow:
+            blurred = cv2.GaussianBlur(alpha, (0, 0), glow * ratio / 2)
+            layers.append(np.minimum(blurred.astype(np.uint16) * 2, 255).astype(np.uint8))
+        # 3) Shadow: offset down and right, softened
+        if shadow:
+            offset = max(1, round(shadow * ratio / 3))
+            shifted = np.zeros_like(alpha)
+            shifted[offset:, offset:] = alpha[:-offset, :-offset]
+            layers.append(cv2.GaussianBlur(shifted, (0, 0), shadow * ratio / 3))
+        # 4) Outline: the glyphs grown by the outline width
+        if outline:
+            k = 2 * max(1, round(outline * ratio)) + 1
+            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k, k))
+            layers.append(cv2.dilate(alpha, kernel))
+        
+        # 5) Slide the layers under the text, topmost first, painting in
+        #    device pixels
+        image.setDevicePixelRatio(1.0)
+        painter = QPainter(image)
+        painter.setCompositionMode(QPainter.CompositionMode_DestinationOver)
+        for layer in reversed(layers):
+            painter.drawImage(QPoint(x0, y0), alpha_layer(layer, color))
+        painter.end()
+        image.setDevicePixelRatio(ratio)
+        return image
+
+    def clear(self):
+        self._images.clear()
+
+def text_fits(text, font, width, height):
+    """Whether text, word-wrapped like a lyric, fits a width x height box."""
+    # Lay out in a box of the target width but unbounded height
+    bounds = QFontMetrics(font).boundingRect(QRect(0, 0, width, 1 << 20), LYRIC_TEXT_FLAGS, text)
+    return bounds.width() <= width and bounds.height() <= height
+
+def parse_song_text(text):
+    """Split pasted song text into stanzas, as a list of (section, lines).
+
+    Stanzas are separated by blank lines; a line such as "[Chorus]" names
+    the section of the stanzas that follow it.
+    """
+    stanzas, section, lines = [], '', []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if len(line) > 2 and line.startswith('[') and line.endswith(']'):
+            if lines:
+                stanzas.append((section, lines))
+                lines = []
+            section = line[1:-1].strip()
+        elif line:
+            lines.append(line)
+        elif lines:
+            stanzas.append((section, lines))
+            lines = []
+    if lines:
+        stanzas.append((section, lines))
+    return stanzas
+
+class SlideSplitter:
+    """Breaks a song into slides that fit the presenter at a given font.
+
+    Slides break only at line ends and never span two stanzas. A stanza that
+    needs n slides is cut into n slides of even length rather than full
+    slides and a short remainder. Measurements are memoized, so re-splitting
+    while the font size changes stays fast.
+    """
+
+    def __init__(self, limit=4096):
+        self.limit = limit
+        self._fits = OrderedDict()
+
+    def fits(self, lines, font, width, height):
+        text = '\n'.join(lines)
+        key = (text, font.key(), width, height)
+        fits = self._fits.get(key)
+        if fits is None:
+            fits = text_fits(text, font, width, height)
+            self._fits[key] = fits
+            while len(self._fits) > self.limit:
+                self._fits.popitem(last=False)
+        return fits
+
+    def split(self, song_text, font, width, height):
+        """Return the slides of a song as [{'text': ..., 'section': ...}]."""
+        slides = []
+        for section, lines in parse_song_text(song_text):
+            for chunk in self._split_stanza(lines, font, width, height):
+                slides.append({'text': '\n'.join(chunk), 'section': section})
+        return slides
+
+    def _split_stanza(self, lines, font, width, height):
+        # 1) Greedy pass: the fewest slides the stanza needs
+        greedy = []
+        for line in lines:
+            if greedy and self.fits(greedy[-1] + [line], font, width, height):
+                greedy[-1].append(line)
+            else:
+                greedy.append([line])
+        if len(greedy) < 2:
+            return greedy
+        
+        # 2) Spread the lines evenly over that many slides, if it still fits
+        per, extra = divmod(len(lines), len(greedy))
+        even, i = [], 0
+        for n in range(len(greedy)):
+            take = per + (1 if n < extra else 0)
+            even.append(lines[i:i + take])
+            i += take
+        if all(self.fits(chunk, font, width, height) for chunk in even):
+            return even
+        return greedy
+
+class FontFitter:
+    """Finds the largest font size at which a text fits a box.
+
+    Sizes are found by a binary search over QFontMetrics and memoized per
+    text, font and box, so each slide of a song is measured once.
+    """
+
+    def __init__(self, limit=1024):
+        self.limit = limit
+        self._sizes = OrderedDict()
+
+    def fit(self, text, font, width, height, max_size, min_size=AUTO_FIT_MIN_SIZE):
+        key = (text, font.key(), width, height, max_size, min_size)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            return size
+        size = self._search(text, font, width, height, max_size, min_size)
+        self._sizes[key] = size
+        while len(self._sizes) > self.limit:
+            self._sizes.popitem(last=False)
+        return size
+
+    @staticmethod
+    def _fits(text, font, size, width, height):
+        probe = QFont(font)
+        probe.setPointSize(size)
+        return text_fits(text, probe, width, height)
+
+    def overflows(self, text, font, width, height, max_size, min_size=AUTO_FIT_MIN_SIZE):
+        """Whether text is too big for the box even at the size fit() picks."""
+        size = self.fit(text, font, width, height, max_size, min_size)
+        return not self._fits(text, font, size, width, height)
+
+    def _search(self, text, font, width, height, max_size, min_size):
+        lo, hi = min_size, max(min_size, max_size)
+        if width <= 0 or height <= 0 or not self._fits(text, font, lo, width, height):
+            return lo
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._fits(text, font, mid, width, height):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+class LyricTransition:
+    """One lyric change on the compositor's timeline.
+
+    The outgoing lyric and next line are mixed with the incoming ones by a
+    single eased progress value, computed from the clock at paint time.
+    """
+    EASING = QEasingCurve(QEasingCurve.InOutQuad)
+
+    def __init__(self, kind, duration, lyric_from, next_from, start):
+        self.kind = kind if kind in LYRIC_TRANSITIONS else "crossfade"
+        self.duration = duration
+        self.lyric_from = lyric_from
+        self.next_from = next_from
+        self.start = start
+
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (now - self.start) / self.duration))
+
+    def retarget(self, kind, duration, lyric, next_text, now):
+        """Head for new texts from wherever the running transition is.
+
+        Past the halfway point the text that was coming in is the one on
+        screen, so it becomes the outgoing text; progress is mirrored so
+        its opacity carries on without a jump.
+        """
+        p = self.progress(now)
+        if p >= 0.5:
+            self.lyric_from, self.next_from = lyric, next_text
+            p = 1.0 - p
+        self.kind = kind if kind in LYRIC_TRANSITIONS else "crossfade"
+        self.duration = duration
+        self.start = now - p * duration
+
+    def mix(self, p, distance):
+        """Return (out opacity, in opacity, out offset, in offset) at progress p."""
+        if self.kind == "cut":
+            return 0.0, 1.0, 0, 0
+        if self.kind == "fade":
+            # Fade through: out over the first half, in over the second
+            if p < 0.5:
+                return 1.0 - self.EASING.valueForProgress(p * 2), 0.0, 0, 0
+            return 0.0, self.EASING.valueForProgress(p * 2 - 1), 0, 0
+        e = self.EASING.valueForProgress(p)
+        if self.kind == "slide":
+            return 1.0 - e, e, int(-e * distance), int((1.0 - e) * distance)
+        return 1.0 - e, e, 0, 0
+
+class CompositorWidget(QWidget):
+    """Presenter surface that draws the background frame, the current lyric
+    and the next-line preview in a single paint pass.
+
+    Layer opacities are applied by the painter, so a video frame costs one
+    repaint of this widget instead of one per stacked label. Lyric changes
+    run as one LyricTransition whose progress is taken at paint time, so
+    text moves in step with the frames that are actually shown.
+
+    With a frame sink attached, each change to the picture is composited
+    once, into the sink, and the screen shows that same image when the
+    sizes match.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.frame = None
+        self._frame_data = None          # keeps the pixels behind frame alive
+        self.incoming = None             # next video's frame during a crossfade
+        self._incoming_data = None
+        self._video_mix = 0.0
+        self.recycle = None              # called with frame buffers no longer shown
+        self.text_cache = LyricRasterCache()
+        # Texts to render while the event loop is idle, newest last
+        self._prerender = deque(maxlen=4 * LYRIC_LOOKAHEAD)
+        self._prerender_timer = QTimer(self)
+        self._prerender_timer.setInterval(0)
+        self._prerender_timer.timeout.connect(self._prerender_next)
+        self.lyric_text = ''
+        self.next_text = ''
+        self.next_visible = False
+        self._transition = None
+        # Keeps frames coming while a transition runs without a video
+        self._transition_timer = QTimer(self)
+        self._transition_timer.setTimerType(Qt.PreciseTimer)
+        self._transition_timer.setInterval(16)
+        self._transition_timer.timeout.connect(self._changed)
+        self.font_color = QColor('white')
+        self.lyric_font = QFont()
+        self.next_font = QFont()
+        self.margins = [50, 0, 50, 0]
+        self.auto_fit = False
+        self.auto_fit_max = 120
+        self.effects = NO_TEXT_EFFECTS
+        self.output_mode = "video"
+        self.key_color = QColor('#00ff00')
+        self.blackout = False
+        self.font_fitter = FontFitter()
+        self.sink = None                 # SharedFrameSink fed with this picture
+        self._generation = 0             # bumped on every change to the picture
+        self._published = None           # (generation, image) last given to the sink
+        # Publishes changes while nothing repaints, e.g. with the window hidden
+        self._publish_timer = QTimer(self)
+        self._publish_timer.setSingleShot(True)
+        self._publish_timer.setInterval(0)
+        self._publish_timer.timeout.connect(self.publish)
+
+    def _changed(self):
+        """Repaint, and have the sink's copy brought up to date."""
+        self._generation += 1
+        self.update()
+        if self.sink is not None:
+            self._publish_timer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # The sink keeps its size, but the layout it shows has changed
+        self._changed()
+
+    def set_sink(self, sink):
+        self.sink = sink
+        self._published = None
+        self._changed()
+
+    def publish(self):
+        """Give the sink the current picture unless it already has it, and
+        return the sink's image of it (None without a sink)."""
+        if self.sink is None:
+            return None
+        if self._published is None or self._published[0] != self._generation:
+            self._published = (self._generation, self.sink.publish(self))
+        return self._published[1]
+
+    def set_style(self, settings):
+        self.font_color = QColor(settings['font_color'])
+        self.margins = settings['margins']
+        self.lyric_font = QFont()
+        self.lyric_font.setPointSize(settings['font_size'])
+        self.lyric_font.setItalic(settings['italic'])
+        # Next line uses a 50% smaller font, never below 12pt
+        self.next_font = QFont(self.lyric_font)
+        self.next_font.setPointSize(max(12, int(settings['font_size'] * 0.5)))
+        self.auto_fit = settings.get('auto_fit_font', False)
+        self.effects = text_effects(settings)
+        self.auto_fit_max = settings.get('auto_fit_max_size', 120)
+        self._changed()
+
+    def set_output_mode(self, mode, key_color='#00ff00'):
+        """Choose what is behind the lyrics: the video, nothing, or a key color."""
+        self.output_mode = mode if mode in OUTPUT_MODES else "video"
+        self.key_color = QColor(key_color)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, self.output_mode != "transparent")
+        if self.output_mode != "video":
+            # Let go of the last video frames
+            self.promote_incoming()
+            self.set_frame(None)
+        self._changed()
+
+    def set_blackout(self, blackout):
+        """Hide the video and lyrics, leaving only the background color."""
+        self.blackout = blackout
+        self._changed()
+
+    def _release(self, data):
+        if data is not None and self.recycle is not None:
+            self.recycle(data)
+
+    def set_frame(self, image, data=None):
+        """Show a video frame; data is the buffer the image points into."""
+        old = self._frame_data
+        self.frame = image
+        self._frame_data = data
+        if old is not data:
+            self._release(old)
+        self._changed()
+
+    def set_incoming_frame(self, image, data=None):
+        """Show a frame of the video being crossfaded in."""
+        old = self._incoming_data
+        self.incoming = image
+        self._incoming_data = data
+        if old is not data:
+            self._release(old)
+        self._changed()
+
+    def promote_incoming(self):
+        """End a crossfade: the incoming video becomes the background."""
+        if self.incoming is not None:
+            self._release(self._frame_data)
+            self.frame, self._frame_data = self.incoming, self._incoming_data
+        self.incoming = None
+        self._incoming_data = None
+        self._video_mix = 0.0
+        self._changed()
+
+    def set_lyric_text(self, text):
+        self.transition_to(lyric=text, kind="cut")
+
+    def set_next_text(self, text):
+        self.transition_to(next_text=text, kind="cut")
+
+    def transition_to(self, lyric=None, next_text=None, kind="crossfade", duration=0.5):
+        """Change the lyric and/or next line (None keeps a layer as it is).
+
+        A change arriving while a transition runs retargets it rather than
+        starting over from the old text.
+        """
+        lyric = self.lyric_text if lyric is None else lyric
+        next_text = self.next_text if next_text is None else next_text
+        if (lyric, next_text) == (self.lyric_text, self.next_text):
+            return
+        now = time.monotonic()
+        t = self._transition
+        if kind == "cut" or duration <= 0:
+            self._transition = None
+            self._transition_timer.stop()
+        elif t is not None and t.progress(now) < 1.0:
+            t.retarget(kind, duration, self.lyric_text, self.next_text, now)
+        else:
+            self._transition = LyricTransition(kind, duration, self.lyric_text, self.next_text, now)
+            self._transition_timer.start()
+        self.lyric_text, self.next_text = lyric, next_text
+        self._changed()
+
+    def set_next_visible(self, visible):
+        self.next_visible = visible
+        self._changed()
+
+    def getVideoMix(self):
+        return self._video_mix
+
+    def setVideoMix(self, value):
+        self._video_mix = value
+        self._changed()
+
+    # 0 shows only the current video, 1 only the incoming one
+    videoMix = pyqtProperty(float, getVideoMix, setVideoMix)
+
+    def lyric_rect(self, r=None):
+        r = self.rect() if r is None else r
+        return r.adjusted(self.margins[0], self.margins[1], -self.margins[2], -self.margins[3])
+
+    def slide_rect(self, r=None):
+        """Return the box a lyric is laid out and drawn in.
+
+        With the next line shown, the box is kept clear of it on both
+        sides, since the lyric is centered vertically.
+        """
+        r = self.rect() if r is None else r
+        area = self.lyric_rect(r)
+        if self.next_visible:
+            overlap = max(0, area.bottom() - self.next_line_rect(r).top())
+            area = area.adjusted(0, overlap, 0, -overlap)
+        return area
+
+    def slide_area(self, size=None):
+        """Return the size a slide's text must fit in for an output size."""
+        return self.slide_rect(None if size is None else QRect(QPoint(0, 0), size)).size()
+
+    def lyric_font_for(self, text):
+        """Return the font a lyric is drawn in: the style's font, or with
+        auto-fit the largest size at which the text fits the slide box."""
+        if not self.auto_fit:
+            return self.lyric_font
+        r = self.slide_rect()
+        size = self.font_fitter.fit(text, self.lyric_font, r.width(), r.height(), self.auto_fit_max)
+        font = QFont(self.lyric_font)
+        font.setPointSize(size)
+        return font
+
+    def lyric_image(self, text):
+        return self.text_cache.get(text, self.lyric_font_for(text), self.font_color, LYRIC_TEXT_FLAGS,
+                                   self.slide_rect().size(), self.devicePixelRatioF(), self.effects)
+
+    def next_line_image(self, text):
+        return self.text_cache.get(text, self.next_font, self.font_color, LYRIC_TEXT_FLAGS,
+                                   self.next_line_rect().size(), self.devicePixelRatioF(), self.effects)
+
+    def prerender(self, texts, urgent=False):
+        """Queue texts to be rendered during idle time, as the lyric and as
+        the next-line preview, so showing them later is a cache hit.
+        Urgent texts go ahead of anything already queued."""
+        texts = [text for text in texts if text and text.strip()]
+        if urgent:
+            self._prerender.extendleft(reversed(texts))
+        else:
+            self._prerender.extend(texts)
+        if self._prerender:
+            self._prerender_timer.start()
+
+    def _prerender_next(self):
+        # One text per idle tick, so input and frames are never held up
+        if not self._prerender:
+            self._prerender_timer.stop()
+            return
+        text = self._prerender.popleft()
+        self.lyric_image(text)
+        if self.next_visible:
+            self.next_line_image(text)
+
+    def next_line_rect(self, r=None):
+        r = self.rect() if r is None else r
+        # Calculate height based on font size (approximate)
+        line_height = int(self.next_font.pointSize() * 1.5)
+        
+        # Position at bottom with some padding, 10% in from each side
+        next_rect = r.adjusted(int(r.width() * 0.1), int(r.height() - line_height * 3),
+                               int(-r.width() * 0.1), int(-line_height * 0.5))
+        return next_rect.adjusted(self.margins[0], 0, -self.margins[2], -20)
+
+    def _draw_frame(self, painter, frame):
+        if frame is None or frame.isNull():
+            return
+        if frame.size() == self.size():
+            painter.drawImage(0, 0, frame)
+        else:
+            # Letterboxed "fit" frames, or frames still at the old size
+            # while a resize reaches the decoder
+            target = QRect(QPoint(0, 0), frame.size().scaled(self.size(), Qt.KeepAspectRatio))
+            target.moveCenter(self.rect().center())
+            painter.drawImage(target, frame)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # The sink's image of the picture, when it is the screen's size,
+        # saves compositing it a second time
+        image = self.publish()
+        if image is not None and image.size() == self.size() * self.devicePixelRatioF():
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.drawImage(self.rect(), image)
+        else:
+            self._compose(painter)
+        painter.end()
+
+    def _compose(self, painter):
+        # 1) Background frame (already scaled by the decoder), blended with
+        #    the incoming video while crossfading; lyrics-only outputs get
+        #    a cleared or key-colored background instead
+        if self.output_mode == "transparent":
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.fillRect(self.rect(), Qt.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        elif self.output_mode == "key_color":
+            painter.fillRect(self.rect(), self.key_color)
+        else:
+            painter.fillRect(self.rect(), Qt.black)
+            if not self.blackout:
+                self._draw_frame(painter, self.frame)
+                if self.incoming is not None and self._video_mix > 0:
+                    painter.setOpacity(self._video_mix)
+                    self._draw_frame(painter, self.incoming)
+                    painter.setOpacity(1.0)
+        
+        # 2) Lyric and next line, pre-rendered by the text cache and mixed
+        #    by the running transition
+        t = self._transition
+        p = 1.0
+        if t is not None:
+            p = t.progress(time.monotonic())
+            if p >= 1.0:
+                self._transition = None
+                self._transition_timer.stop()
+                t = None
+        if not self.blackout:
+            self._draw_text_layer(painter, self.lyric_image, self.slide_rect(),
+                                  t.lyric_from if t else None, self.lyric_text, 1.0, t, p)
+        if self.next_visible and not self.blackout:
+            self._draw_text_layer(painter, self.next_line_image, self.next_line_rect(),
+                                  t.next_from if t else None, self.next_text,
+                                  NEXT_LINE_OPACITY, t, p)
+
+    def render_to(self, image):
+        """Paint the current picture into image, scaled to fit its size."""
+        painter = QPainter(image)
+        painter.scale(image.width() / max(1, self.width()), image.height() / max(1, self.height()))
+        self._compose(painter)
+        painter.end()
+
+    def _draw_text_layer(self, painter, render, rect, old, new, opacity, t, p):
+        if t is None or old == new:
+            layers = [(new, opacity, 0)]
+        else:
+            out_a, in_a, out_dy, in_dy = t.mix(p, self.height() * 0.1)
+            layers = [(old, opacity * out_a, out_dy), (new, opacity * in_a, in_dy)]
+        for text, alpha, dy in layers:
+            if text and text.strip() and alpha > 0:
+                painter.setOpacity(alpha)
+                painter.drawImage(rect.topLeft() + QPoint(0, dy), render(text))
+        painter.setOpacity(1.0)
+
+class SharedFrameSink:
+    """Publishes composited presenter frames into a named shared-memory
+    ring buffer, for local consumers such as a streaming encoder.
+
+    Segment layout (little endian, see frame_sink_reader.py):
+      header, 64 bytes: magic (8s), version, slot count, width, height,
+                        stride, format (6 x u32), slot size, latest
+                        sequence number (2 x u64)
+      slots, each slot size bytes: sequence number (u64), timestamp in
+                        seconds (f64), padding to 64 bytes, pixels
+
+    Frames are painted straight into the next slot. Its sequence number
+    is zeroed first and set once the frame is complete, then the header's
+    latest sequence number is moved on; a reader that finds the slot's
+    number unchanged after using the pixels knows they were not
+    overwritten meanwhile.
+    """
+    HEADER = struct.Struct('<8s6I2Q')
+    SLOT = struct.Struct('<Qd')
+    HEADER_SIZE = 64
+    SLOT_HEADER_SIZE = 64
+    VERSION = 1
+
+    def __init__(self, name, width, height, slots=3):
+        self.name = name
+        self.width, self.height = max(1, width), max(1, height)
+        self.slots = max(2, slots)
+        self.stride = self.width * 4
+        self.slot_size = self.SLOT_HEADER_SIZE + self.stride * self.height
+        size = self.HEADER_SIZE + self.slots * self.slot_size
+        try:
+            self.shm = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a presenter that did not shut down cleanly
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name, create=True, size=size)
+        self.seq = 0
+        self._write_header()
+        # A QImage over each slot's pixels, painted into without copying;
+        # it needs a plain pointer, a buffer object would be copied on write
+        self._pixels = []
+        self._images = []
+        for i in range(self.slots):
+            offset = self.HEADER_SIZE + i * self.slot_size + self.SLOT_HEADER_SIZE
+            pixels = np.ndarray((self.height, self.stride), np.uint8, self.shm.buf, offset)
+            self._pixels.append(pixels)
+            self._images.append(QImage(sip.voidptr(pixels.ctypes.data), self.width, self.height,
+                                       self.stride, QImage.Format_ARGB32_Premultiplied))
+
+    def _write_header(self):
+        self.HEADER.pack_into(self.shm.buf, 0, FRAME_SINK_MAGIC, self.VERSION, self.slots,
+                              self.width, self.height, self.stride, FRAME_SINK_FORMAT_BGRA,
+                              self.slot_size, self.seq)
+
+    def publish(self, compositor):
+        """Paint compositor's current picture as the next frame, and return
+        the slot's image of it."""
+        seq = self.seq + 1
+        index = seq % self.slots
+        offset = self.HEADER_SIZE + index * self.slot_size
+        # 1) Invalidate the slot, 2) paint, 3) stamp it, 4) announce it
+        self.SLOT.pack_into(self.shm.buf, offset, 0, 0.0)
+        compositor.render_to(self._images[index])
+        self.SLOT.pack_into(self.shm.buf, offset, seq, time.time())
+        self.seq = seq
+        struct.pack_into('<Q', self.shm.buf, self.HEADER.size - 8, seq)
+        return self._images[index]
+
+    def close(self):
+        # The views must go before the segment can be unmapped
+        self._images = []
+        self._pixels = []
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+class OutputWindow(QWidget):
+    """Additional presenter output, such as a stage monitor or an operator
+    preview, with its own size and layers.
+
+    It shows what the presenter shows but never opens a video itself: the
+    presenter hands it frames its decoders already scaled for this size.
+    """
+    resized = pyqtSignal()
+    shownChanged = pyqtSignal()          # shown, hidden, minimized or restored
+
+    def __init__(self, config):
+        super().__init__(None, Qt.Window)
+        # For the transparent output mode, as on the presenter window
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.config = dict(config)
+        self.setWindowTitle(self.config.get('name', 'Output'))
+        self.resize(640, 360)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.compositor = CompositorWidget(self)
+        layout.addWidget(self.compositor)
+
+    def shows_video(self):
+        return self.config.get('video', True)
+
+    def shows_next_line(self):
+        return self.config.get('next_line', True)
+
+    def video_size(self):
+        """Size the decoders scale this output's frames to, or None."""
+        return (self.width(), self.height()) if self.shows_video() else None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.shownChanged.emit()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.shownChanged.emit()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.shownChanged.emit()
+
+    def mouseDoubleClickEvent(self, event):
+        if self.isFullScreen():
+            self.showNormal()
+        else:
+            self.showFullScreen()
 
 class PresenterWindow(QWidget):
     # Custom signal for visibility changes
@@ -419,9 +3283,28 @@ class PresenterWindow(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         
         # Initialize video and overlay first
-        self.cap = None
+        self.decoder = None
+        self.incoming = None             # next video, prebuffering for a crossfade
+        self.video_path = None
+        self.loop_cache = LoopCache(LOOP_CACHE_DIR,
+                                    self.defaults.get('loop_cache_clip_mb', 1024),
+                                    self.defaults.get('loop_cache_quota_mb', 8192))
+        self.keyframe_index = KeyframeIndex(KEYFRAME_INDEX_FILE)
+        self.proxy_index = ProxyIndex()
+        self.first_frames = FirstFrameCache(FIRST_FRAME_DIR, self.loop_cache)
+        self.decoder_pool = DecoderPool(self.defaults.get('decoder_pool_size', 3))
+        self.frame_pool = FramePool()
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self._next_frame)
+        self.clock = PlaybackClock()
+        self.incoming_clock = PlaybackClock()
+        self._crossfade_anim = None
+        self.frames_dropped = 0
+        self.frames_repeated = 0
+        self.outputs = []                # OutputWindows fed from the same decode
+        self.frame_sink = None           # SharedFrameSink, when enabled
+        self._suspended = True           # no frames are pulled until shown
         
         # Initialize window dragging attributes
         self.draggable = True
@@ -432,12 +3315,7 @@ class PresenterWindow(QWidget):
         # Main widget with shadow effect
         self.main_widget = QWidget(self)
         self.main_widget.setObjectName("mainWidget")
-        self.main_widget.setStyleSheet("""
-            #mainWidget {
-                background-color: #000000;
-                border-radius: 0px;
-            }
-        """)
+        self._set_background("#000000")
         
         # Create context menu for window controls
         self.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -454,40 +3332,195 @@ class PresenterWindow(QWidget):
         self.main_widget.mouseMoveEvent = self.mouseMoveEvent
         self.main_widget.mouseReleaseEvent = self.mouseReleaseEvent
         
-        # Video and overlay
-        self.video_label = QLabel()
-        self.video_label.setScaledContents(True)
-        layout.addWidget(self.video_label)
-        
-        self.overlay = QLabel("", self.main_widget)
-        self.overlay.setAlignment(Qt.AlignCenter)
-        
-        # Next line overlay
-        self.next_line_overlay = QLabel("Next line here", self.main_widget)
-        self.next_line_overlay.setAlignment(Qt.AlignCenter)
-        self.next_line_overlay.setWordWrap(True)
-        self.next_line_overlay.setVisible(self.defaults.get('show_next_line', False))  # Set initial visibility
+        # Video, lyric and next line are all drawn by one compositor
+        self.compositor = CompositorWidget(self.main_widget)
+        self.compositor.recycle = self.frame_pool.put
+        self._shared = {}                # id -> [buffer, outputs showing it], see _fan_out
+        layout.addWidget(self.compositor)
         
         # Flag to enable/disable next line overlay
         self.show_next_line = self.defaults.get('show_next_line', False)
+        self.compositor.set_next_visible(self.show_next_line)
         
-        self.overlay.raise_()  # Make sure overlay is on top
-        self.next_line_overlay.raise_()
-        
+        self.set_outputs(self.defaults.get('outputs', []))
         self.apply_style()
+        self.apply_output_mode()
+        self.apply_frame_sink()
+        
+    def _set_background(self, color):
+        self.main_widget.setStyleSheet(f"""
+            #mainWidget {{
+                background-color: {color};
+                border-radius: 0px;
+            }}
+        """)
+
+    def lyrics_only(self):
+        """Whether the output shows lyrics without any background video."""
+        return self.defaults.get('output_mode', 'video') != 'video'
+
+    def apply_output_mode(self):
+        mode = self.defaults.get('output_mode', 'video')
+        for comp, _ in self._text_outputs():
+            comp.set_output_mode(mode, self.defaults.get('key_color', '#00ff00'))
+        self._set_background('transparent' if mode == 'transparent' else '#000000')
+        if self.lyrics_only():
+            # Close every capture; nothing is decoded until video comes back
+            if self.decoder or self.incoming:
+                self.set_video(self.video_path)
+            self.decoder_pool.clear()
+        elif self.video_path and not self.decoder and not self.incoming:
+            self.set_video(self.video_path)
+
+    def apply_frame_sink(self):
+        """Open, resize or close the shared-memory frame sink per the settings."""
+        config = None
+        if self.defaults.get('frame_sink', False):
+            w, h = self.defaults.get('frame_sink_size', [1920, 1080])
+            config = (self.defaults.get('frame_sink_name', 'jsgc-presenter-frames'),
+                      w, h, self.defaults.get('frame_sink_slots', 3))
+        sink = self.frame_sink
+        if sink is not None and config == (sink.name, sink.width, sink.height, sink.slots):
+            return
+        if sink is not None:
+            self.compositor.set_sink(None)
+            sink.close()
+            self.frame_sink = None
+        if config is not None:
+            try:
+                self.frame_sink = SharedFrameSink(*config)
+            except (OSError, ValueError) as e:
+                print(f"Could not open frame sink {config[0]}: {e}")
+            else:
+                if not self.isVisible():
+                    # Never shown, the compositor has not been laid out yet
+                    self.main_widget.resize(self.size())
+                    self.main_widget.layout().activate()
+                self.compositor.set_sink(self.frame_sink)
+        self._update_suspended()
+
+    def set_outputs(self, configs):
+        """Open an OutputWindow for each enabled output config."""
+        enabled = [dict(config) for config in configs if config.get('enabled', False)]
+        if enabled == [output.config for output in self.outputs]:
+            return
+        for output in self.outputs:
+            # Give back the frames it shows before it goes
+            output.compositor.set_incoming_frame(None)
+            output.compositor.set_frame(None)
+            output.close()
+        self.outputs = []
+        for config in enabled:
+            output = OutputWindow(config)
+            output.compositor.recycle = self._release_shared
+            output.compositor.set_style(self.defaults)
+            output.compositor.set_output_mode(self.compositor.output_mode,
+                                              self.compositor.key_color.name())
+            output.compositor.set_blackout(self.compositor.blackout)
+            output.compositor.set_next_visible(output.shows_next_line())
+            output.compositor.set_lyric_text(self.compositor.lyric_text)
+            output.compositor.set_next_text(self.compositor.next_text)
+            output.resized.connect(self._update_extra_sizes)
+            output.shownChanged.connect(self._update_suspended)
+            self.outputs.append(output)
+            if self.isVisible():
+                output.show()
+        self._update_extra_sizes()
+        self._update_suspended()
+
+    def _on_screen(self):
+        """Whether anything consumes the frames: a window that can currently
+        be seen, or the frame sink."""
+        if self.frame_sink is not None:
+            return True
+        for window in [self] + self.outputs:
+            handle = window.windowHandle()
+            if window.isVisible() and not window.isMinimized() and handle is not None \
+                    and handle.isExposed():
+                return True
+        return False
+
+    def _update_suspended(self):
+        """Pause playback while nothing consumes the frames, and resume it
+        from the same frame once something does.
+
+        Nothing special is needed to hold the position: with no frames
+        taken, each decoder fills its buffer and then waits, so the frames
+        after the last one shown are ready the moment playback resumes.
+        """
+        suspended = not self._on_screen()
+        if suspended == self._suspended:
+            return
+        self._suspended = suspended
+        if suspended:
+            if self._crossfade_anim is not None:
+                # Nobody sees the crossfade; finish it now
+                self._crossfade_anim.stop()
+                self._promote_incoming()
+            self.timer.stop()
+        else:
+            # Restart the clocks at the first buffered frame
+            self.clock.reset()
+            self.incoming_clock.reset()
+            self._restart_timer()
+            self._next_frame()
+
+    def eventFilter(self, obj, event):
+        # Exposure changes when the window is fully covered or uncovered
+        if obj is self.windowHandle() and event.type() == QEvent.Expose:
+            QTimer.singleShot(0, self._update_suspended)
+        return False
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_suspended()
+
+    def _text_outputs(self):
+        """Return (compositor, shows the next line) for every output."""
+        return [(self.compositor, self.show_next_line)] + \
+               [(o.compositor, o.shows_next_line()) for o in self.outputs]
+
+    def _extra_sizes(self):
+        return [size for size in (o.video_size() for o in self.outputs) if size]
+
+    def _update_extra_sizes(self):
+        sizes = self._extra_sizes()
+        for decoder in (self.decoder, self.incoming):
+            if decoder:
+                decoder.set_extra_sizes(sizes)
         
     def showEvent(self, event):
         """Override show event to emit visibility changed signal."""
         super().showEvent(event)
+        for output in self.outputs:
+            output.show()
+        self.apply_frame_sink()
+        handle = self.windowHandle()
+        if handle is not None:
+            handle.removeEventFilter(self)
+            handle.installEventFilter(self)
+        self._update_suspended()
         self.visibilityChanged.emit(True)
         
     def hideEvent(self, event):
         """Override hide event to emit visibility changed signal."""
         super().hideEvent(event)
+        for output in self.outputs:
+            output.hide()
+        self._update_suspended()
         self.visibilityChanged.emit(False)
         
     def closeEvent(self, event):
         """Override close event to emit visibility changed signal."""
+        self.set_video(None)
+        self.decoder_pool.clear()
+        for output in self.outputs:
+            output.close()
+        if self.frame_sink is not None:
+            self.compositor.set_sink(None)
+            self.frame_sink.close()
+            self.frame_sink = None
         if hasattr(self, 'visibilityChanged'):
             self.visibilityChanged.emit(False)
         super().closeEvent(event)
@@ -522,140 +3555,351 @@ class PresenterWindow(QWidget):
         """Update the presenter window settings"""
         self.defaults.update(settings)
         self.show_next_line = settings.get('show_next_line', False)
-        self.next_line_overlay.setVisible(self.show_next_line)
+        self.compositor.set_next_visible(self.show_next_line)
+        if 'outputs' in settings:
+            self.set_outputs(self.defaults['outputs'])
+        self.loop_cache.set_limits(self.defaults.get('loop_cache_clip_mb', 1024),
+                                   self.defaults.get('loop_cache_quota_mb', 8192))
+        self.decoder_pool.set_capacity(self.defaults.get('decoder_pool_size', 3))
+        for decoder in (self.decoder, self.incoming):
+            if decoder:
+                decoder.set_depth(self.defaults.get('frame_buffer_depth', 3))
+                decoder.set_scale_mode(self.defaults.get('video_scale_mode', 'fill'))
         self.apply_style()
+        self.apply_output_mode()
+        self.apply_frame_sink()
         
     def apply_style(self):
-        d = self.defaults
-        
-        # Main overlay style
-        style = f"color:{d['font_color']};font-size:{d['font_size']}pt;background:transparent;"
-        if d['italic']:
-            style += "font-style:italic;"
-        self.overlay.setStyleSheet(style)
-        self.overlay.setWordWrap(True)
-        self.overlay.setContentsMargins(d['margins'][0], 0, d['margins'][2], 0)
-        
-        # Next line overlay style (50% smaller font, 50% opacity)
-        next_line_font_size = max(12, int(d['font_size'] * 0.5))  # Ensure minimum 12pt
-        next_line_style = f"""
-            color: {d['font_color']};
-            font-size: {next_line_font_size}pt;
-            background: transparent;
-            opacity: 0.5;
-        """
-        if d['italic']:
-            next_line_style += "font-style:italic;"
-        self.next_line_overlay.setStyleSheet(next_line_style)
-        self.next_line_overlay.setContentsMargins(d['margins'][0], 0, d['margins'][2], 20)  # Add bottom margin
+        for comp, _ in self._text_outputs():
+            comp.set_style(self.defaults)
         
     def set_next_line(self, text):
         """Update the next line overlay text and make it visible if show_next_line is True"""
-        self.next_line_overlay.setText(text)
-        self.next_line_overlay.setVisible(self.show_next_line)
+        for comp, shows_next in self._text_outputs():
+            comp.set_next_text(text)
+            comp.set_next_visible(shows_next)
         
     def set_next_lyric(self, text=''):
-        """Set the text for the next lyric line with fade animation.
+        """Set the text for the next lyric line with a transition.
         
         Args:
             text (str): The text of the next lyric line, or empty string to hide
         """
-        if not hasattr(self, 'next_line_overlay'):
-            return
-            
-        # If no text or next line is disabled, just hide immediately
-        if not text or not self.show_next_line:
-            self.next_line_overlay.setVisible(False)
-            return
-            
-        # 1) Ensure we have one shared opacity effect
-        if not hasattr(self, '_next_line_opacity_effect'):
-            eff = QGraphicsOpacityEffect(self.next_line_overlay)
-            self.next_line_overlay.setGraphicsEffect(eff)
-            self._next_line_opacity_effect = eff
-        else:
-            eff = self._next_line_opacity_effect
-            
-        # 2) Stop any running animation
-        if hasattr(self, '_next_line_current_anim'):
-            self._next_line_current_anim.stop()
-            del self._next_line_current_anim
-            
-        fade_duration = int(self.defaults.get('fade_duration', 300))  # Default to 300ms if not set
-        
-        # 3) Fade-out current text if visible
-        if self.next_line_overlay.isVisible():
-            fade_out = QPropertyAnimation(eff, b"opacity", self)
-            fade_out.setDuration(fade_duration)
-            fade_out.setStartValue(eff.opacity())
-            fade_out.setEndValue(0.0)
-            fade_out.setEasingCurve(QEasingCurve.InOutQuad)
-            
-            # 4) Once faded out, update text and fade in
-            def on_fade_out_finished():
-                self.next_line_overlay.setText(text)
-                self.next_line_overlay.setVisible(True)
-                
-                fade_in = QPropertyAnimation(eff, b"opacity", self)
-                fade_in.setDuration(fade_duration)
-                fade_in.setStartValue(0.0)
-                fade_in.setEndValue(0.5)  # Keep next line at half opacity
-                fade_in.setEasingCurve(QEasingCurve.InOutQuad)
-                fade_in.start()
-                
-                # Keep reference to prevent garbage collection
-                self._next_line_current_anim = fade_in
-                
-            fade_out.finished.connect(on_fade_out_finished)
-            fade_out.start()
-            self._next_line_current_anim = fade_out
-        else:
-            # If not currently visible, just set text and fade in
-            self.next_line_overlay.setText(text)
-            self.next_line_overlay.setVisible(True)
-            eff.setOpacity(0.0)  # Start transparent
-            
-            fade_in = QPropertyAnimation(eff, b"opacity", self)
-            fade_in.setDuration(fade_duration)
-            fade_in.setStartValue(0.0)
-            fade_in.setEndValue(0.5)  # Keep next line at half opacity
-            fade_in.setEasingCurve(QEasingCurve.InOutQuad)
-            fade_in.start()
-            
-            self._next_line_current_anim = fade_in
+        for comp, shows_next in self._text_outputs():
+            # If no text or next line is disabled, just hide immediately
+            if not text or not shows_next:
+                comp.set_next_visible(False)
+                continue
+            comp.set_next_visible(True)
+            self._start_transition(comp, next_text=text)
+
+    def _start_transition(self, comp, lyric=None, next_text=None):
+        kind = self.defaults.get('lyric_transition', 'crossfade')
+        duration = self.defaults.get('fade_duration', 0.5)
+        if kind == 'fade':
+            # Fading out and back in takes a fade duration each
+            duration *= 2
+        comp.transition_to(lyric, next_text, kind, duration)
     
+    def _pull_frame(self, decoder, clock):
+        """Take the frame of decoder that is due on clock, or None.
+
+        Returns (image, pixels, extras), extras being the frame scaled for
+        the other outputs (see VideoDecoder.set_extra_sizes).
+        """
+        # Frames arrive converted and scaled by the decoder thread and
+        # are shown by timestamp; when we fall behind, late frames are
+        # skipped rather than slowing playback down
+        interval = 1 / decoder.fps
+        if not clock.running:
+            frame = decoder.take_frame()
+            if frame is None:
+                return None
+            clock.start_at(frame[0])
+        else:
+            now = clock.now()
+            frame, dropped = decoder.take_due(now)
+            self.frames_dropped += dropped
+            if frame is None:
+                if now >= clock.next_due:
+                    # A frame was due but none was ready
+                    self.frames_repeated += 1
+                    clock.next_due += interval
+                return None
+        clock.next_due = frame[0] + interval
+        wrapped = self._wrap_frame(frame[1])
+        return wrapped + (frame[2],) if wrapped else None
+
+    def _wrap_frame(self, pixels):
+        # Wrap the decoded buffer without copying; the compositor keeps
+        # the array alive for as long as it shows the image, then hands
+        # it back to the frame pool
+        h, w, _ = pixels.shape
+        img = QImage(pixels.data, w, h, 3*w, FRAME_IMAGE_FORMAT)
+        if img.isNull():
+            return None
+        return img, pixels
+
+    def _first_frame(self, decoder):
+        """Return the cached first frame of decoder's video, as the window shows it."""
+        pixels = self.first_frames.load(decoder.path, decoder.loop_in,
+                                        (self.width(), self.height()),
+                                        self.defaults.get('video_scale_mode', 'fill'))
+        if pixels is None:
+            return None
+        return self._wrap_frame(pixels)
+
     def _next_frame(self):
         try:
-            if not hasattr(self, 'cap') or self.cap is None:
-                return
-                
-            ret, frame = self.cap.read()
-            if not ret:
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                return
-            
-            if frame is not None and frame.size > 0:
-                h, w, _ = frame.shape
-                if h > 0 and w > 0:
-                    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    img = QImage(rgb.data, w, h, 3*w, QImage.Format_RGB888)
-                    if not img.isNull():
-                        self.video_label.setPixmap(QPixmap.fromImage(img).scaled(
-                            self.video_label.size(), 
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation
-                        ))
+            if self.decoder is not None:
+                frame = self._pull_frame(self.decoder, self.clock)
+                if frame is not None:
+                    self.compositor.set_frame(frame[0], frame[1])
+                    self._fan_out(frame[2], incoming=False)
+            if self._crossfade_anim is not None:
+                frame = self._pull_frame(self.incoming, self.incoming_clock)
+                if frame is not None:
+                    self.compositor.set_incoming_frame(frame[0], frame[1])
+                    self._fan_out(frame[2], incoming=True)
         except Exception as e:
             print(f"Error updating video frame: {e}")
+
+    def _fan_out(self, extras, incoming):
+        # Every output of the same size shares one scaled copy; an output
+        # whose size the decoder has not caught up with keeps its last frame
+        shown = set()
+        for output in self.outputs:
+            pixels = extras.get(output.video_size())
+            if pixels is None:
+                continue
+            wrapped = self._wrap_frame(pixels)
+            if wrapped is None:
+                continue
+            # Count the outputs showing each copy, so it only goes back to
+            # the frame pool once none of them does (see _release_shared)
+            self._shared.setdefault(id(pixels), [pixels, 0])[1] += 1
+            shown.add(id(pixels))
+            if incoming:
+                output.compositor.set_incoming_frame(*wrapped)
+            else:
+                output.compositor.set_frame(*wrapped)
+        for pixels in extras.values():
+            if id(pixels) not in shown:
+                self.frame_pool.put(pixels)
+
+    def _release_shared(self, pixels):
+        entry = self._shared.get(id(pixels))
+        if entry is None:
+            self.frame_pool.put(pixels)
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._shared[id(pixels)]
+            self.frame_pool.put(pixels)
+
+    def _set_video_mix(self, value):
+        for output in self.outputs:
+            output.compositor.setVideoMix(value)
             
+    def _video_source(self, path):
+        """Pick the file to decode for a video: a proxy if one covers the window."""
+        if self.defaults.get('use_proxies', True):
+            return self.proxy_index.find(path, self.width(), self.height())
+        return path
+
+    def _create_decoder(self, path):
+        """Return a decoder for a video, reusing a parked one if possible."""
+        source = self._video_source(path)
+        points = load_loop_points().get(os.path.basename(path), {})
+        loop_range = (points.get('in', 0.0), points.get('out', 0.0))
+        decoder = self.decoder_pool.take(DecoderPool.key(source, loop_range))
+        if decoder is None:
+            # The file is opened on the decoder thread, not here
+            decoder = VideoDecoder(source, self.defaults.get('frame_buffer_depth', 3), self,
+                                   loop_cache=self.loop_cache,
+                                   keyframe_index=self.keyframe_index,
+                                   loop_range=loop_range,
+                                   first_frames=self.first_frames,
+                                   frame_pool=self.frame_pool)
+            decoder.opened.connect(self._on_video_opened)
+            decoder.ready.connect(self._on_incoming_ready)
+            decoder.underrun.connect(self._on_video_underrun)
+            decoder.error.connect(self._on_video_error)
+        decoder.set_depth(self.defaults.get('frame_buffer_depth', 3))
+        decoder.set_target_size(self.width(), self.height())
+        decoder.set_extra_sizes(self._extra_sizes())
+        decoder.set_scale_mode(self.defaults.get('video_scale_mode', 'fill'))
+        return decoder
+
+    def _release_decoder(self, decoder):
+        if decoder:
+            self.decoder_pool.park(decoder)
+
     def set_video(self, path):
-        if self.cap:
+        """Switch the background video.
+
+        While a video is playing, the new one is opened and prebuffered on a
+        second decoder and crossfaded in once ready; the current video keeps
+        playing until then. Without a crossfade duration the switch is a cut.
+        """
+        self._drop_incoming()
+        duration = self.defaults.get('video_crossfade_duration', 1.0)
+        if self.lyrics_only():
+            # Remember the video for when video output is turned back on,
+            # but never open it
             self.timer.stop()
-            self.cap.release()
+            self._release_decoder(self.decoder)
+            self.decoder = None
+            self.video_path = path
+            return
+        if path and os.path.exists(path) and self.decoder and duration > 0:
+            self.video_path = path
+            self.incoming = self._create_decoder(path)
+            self.incoming_clock.reset()
+            # Start decoding before the crossfade, which may promote the
+            # decoder to the current one straight away
+            if not self.incoming.isRunning():
+                self.incoming.start()
+            if self.incoming.is_ready():
+                # Parked decoder with frames already waiting
+                self._start_crossfade()
+            else:
+                # Fade to the cached first frame while the decoder catches
+                # up; without one, wait for the decoder to prebuffer
+                first = self._first_frame(self.incoming)
+                if first is not None:
+                    self.compositor.set_incoming_frame(*first)
+                    self._start_crossfade()
+            return
+        
+        self.timer.stop()
+        self._release_decoder(self.decoder)
+        self.decoder = None
+        self.video_path = path
         if path and os.path.exists(path):
-            self.cap = cv2.VideoCapture(path)
-            fps = self.cap.get(cv2.CAP_PROP_FPS) or 25
-            self.timer.start(int(1000/fps))
+            self.decoder = self._create_decoder(path)
+            self.clock.reset()
+            first = self._first_frame(self.decoder)
+            if first is not None:
+                self.compositor.set_frame(*first)
+            if self.decoder.isRunning():
+                self._restart_timer()
+            else:
+                # Playback starts once the decoder reports its frame rate
+                self.decoder.start()
+
+    def _on_incoming_ready(self):
+        if self.sender() is self.incoming and self._crossfade_anim is None:
+            self._start_crossfade()
+
+    def _start_crossfade(self):
+        if self._suspended:
+            # Hidden: switch straight over, there is nothing to see. The
+            # decoder must be running so it prebuffers for when it is shown
+            if not self.incoming.isRunning():
+                self.incoming.start()
+            self._promote_incoming()
+            return
+        anim = QPropertyAnimation(self.compositor, b"videoMix", self)
+        anim.setDuration(int(self.defaults.get('video_crossfade_duration', 1.0) * 1000))
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.setEasingCurve(QEasingCurve.InOutQuad)
+        anim.valueChanged.connect(self._set_video_mix)
+        anim.finished.connect(self._promote_incoming)
+        self._crossfade_anim = anim
+        self._restart_timer()
+        self._next_frame()
+        anim.start()
+
+    def _promote_incoming(self):
+        """Make the crossfaded-in video the current one."""
+        self._crossfade_anim = None
+        self._release_decoder(self.decoder)
+        self.decoder, self.incoming = self.incoming, None
+        self.clock, self.incoming_clock = self.incoming_clock, self.clock
+        self.incoming_clock.reset()
+        self.compositor.promote_incoming()
+        for output in self.outputs:
+            output.compositor.promote_incoming()
+        self._restart_timer()
+
+    def _drop_incoming(self):
+        # A crossfade in progress is completed at once; a video that is
+        # still prebuffering is abandoned
+        if self._crossfade_anim is not None:
+            self._crossfade_anim.stop()
+            self._promote_incoming()
+        elif self.incoming:
+            self._release_decoder(self.incoming)
+            self.incoming = None
+
+    def _restart_timer(self):
+        # Poll at twice the fastest frame rate; frames are picked by timestamp
+        playing = [d for d in (self.decoder, self.incoming) if d is not None]
+        if not playing or self._suspended:
+            self.timer.stop()
+            return
+        fps = max(d.fps for d in playing)
+        self.timer.start(max(1, int(500 / fps)))
+
+    def _on_video_opened(self, fps):
+        if self.sender() is self.decoder:
+            self.clock.reset()
+        self._restart_timer()
+
+    def playback_stats(self):
+        """Return counters describing how smoothly the video is playing."""
+        return {
+            'fps': self.decoder.fps if self.decoder else 0.0,
+            'dropped': self.frames_dropped,
+            'repeated': self.frames_repeated,
+            'underruns': self.decoder.underruns if self.decoder else 0
+        }
+
+    def _on_video_error(self, message):
+        print(f"Video decoder error: {message}")
+        # Keep the current video if the next one cannot be played
+        if self.sender() is not self.incoming:
+            return
+        if self._crossfade_anim is not None:
+            # Back out of the crossfade: the outgoing video plays on alone
+            self._crossfade_anim.stop()
+            self._crossfade_anim = None
+            for comp, _ in self._text_outputs():
+                comp.set_incoming_frame(None)
+                comp.setVideoMix(0.0)
+        DecoderPool.close(self.incoming)
+        self.incoming = None
+        self._restart_timer()
+
+    def _on_video_underrun(self, count):
+        print(f"Video frame buffer underrun ({count} so far)")
+
+    def set_blackout(self, blackout):
+        """Blank the projector and every output; the video keeps playing
+        underneath."""
+        for comp, _ in self._text_outputs():
+            comp.set_blackout(blackout)
+
+    def release_videos(self):
+        """Stop the video and close every capture, e.g. before a file is renamed.
+
+        Returns True once the files are closed.
+        """
+        self.set_video(None)
+        # Parked decoders still hold the file open
+        self.decoder_pool.clear()
+        return True
+
+    def slide_area(self):
+        """Return the size a slide's text must fit in at the current size."""
+        return self.compositor.slide_area(self.size())
+
+    def prefetch_lyrics(self, texts):
+        """Render the upcoming slides ahead of time while the presenter is idle."""
+        for comp, _ in self._text_outputs():
+            comp.prerender(texts[:LYRIC_LOOKAHEAD])
 
     def set_lyric(self, text, next_lyric=''):
         # If no text, show song title and set next line to space
@@ -665,80 +3909,33 @@ class PresenterWindow(QWidget):
             if hasattr(self, 'current_song_title'):
                 song_title = self.current_song_title
             
-            # Show song title in main overlay
-            if hasattr(self, 'overlay'):
-                self.overlay.setText(song_title)
-            
-            # Set next line to a single space (not empty string) to maintain layout
-            if hasattr(self, 'next_line_overlay'):
-                self.set_next_lyric(' ')
+            # Show song title in main overlay, with a single space (not an
+            # empty string) in the next line to maintain layout
+            for comp, shows_next in self._text_outputs():
+                if shows_next:
+                    comp.set_next_visible(True)
+                self._start_transition(comp, song_title, ' ')
             return
         
-        # 1) Ensure we have one shared opacity effect
-        if not hasattr(self, "_opacity_effect"):
-            eff = QGraphicsOpacityEffect(self.overlay)
-            self.overlay.setGraphicsEffect(eff)
-            self._opacity_effect = eff
-        else:
-            eff = self._opacity_effect
-
-        # 2) Stop any running animation
-        if hasattr(self, "_current_anim"):
-            self._current_anim.stop()
-            del self._current_anim
-
-        fade_duration = int(self.defaults['fade_duration'] * 1000)
-
-        # 3) Fade-out current text
-        fade_out = QPropertyAnimation(eff, b"opacity", self)
-        fade_out.setDuration(fade_duration)
-        fade_out.setStartValue(eff.opacity())  # from whatever level it is now
-        fade_out.setEndValue(0.0)
-        fade_out.setEasingCurve(QEasingCurve.InOutQuad)
-
-        # 4) Once faded out, swap text and fade in
-        def on_fade_out_finished():
-            # set the new lyric and next lyric
-            self.overlay.setText(text)
-            self.set_next_lyric(next_lyric)
-
-            fade_in = QPropertyAnimation(eff, b"opacity", self)
-            fade_in.setDuration(fade_duration)
-            fade_in.setStartValue(0.0)
-            fade_in.setEndValue(1.0)
-            fade_in.setEasingCurve(QEasingCurve.InOutQuad)
-            fade_in.start()
-
-            # keep reference alive
-            self._current_anim = fade_in
-
-        fade_out.finished.connect(on_fade_out_finished)
-
-        # 5) start fade-out
-        fade_out.start()
-        self._current_anim = fade_out
+        for comp, shows_next in self._text_outputs():
+            # Lay out the new text before the transition needs it
+            comp.prerender([text, next_lyric], urgent=True)
+            if next_lyric and shows_next:
+                comp.set_next_visible(True)
+                self._start_transition(comp, text, next_lyric)
+            else:
+                self._start_transition(comp, text, '')
         
     def resizeEvent(self, ev):
         self.main_widget.resize(self.size())
         r = self.rect()
-        self.video_label.setGeometry(r)
-        self.overlay.setGeometry(r)
-        
-        # Position next line overlay at the bottom
-        if hasattr(self, 'next_line_overlay'):
-            # Calculate height based on font size (approximate)
-            font_size = max(12, int(self.defaults.get('font_size', 48) * 0.5))
-            line_height = int(font_size * 1.5)  # Approximate line height
-            
-            # Position at bottom with some padding
-            x1 = int(r.width() * 0.1)  # 10% from left
-            y1 = int(r.height() - line_height * 3)  # Position up from bottom
-            x2 = int(-r.width() * 0.1)  # 10% from right
-            y2 = int(-line_height * 0.5)  # Small bottom padding
-            next_line_rect = r.adjusted(x1, y1, x2, y2)
-            self.next_line_overlay.setGeometry(next_line_rect)
-            self.next_line_overlay.show() if self.show_next_line else self.next_line_overlay.hide()
-            
+        for decoder in (self.decoder, self.incoming):
+            if decoder:
+                decoder.set_target_size(r.width(), r.height())
+        latest = self.incoming or self.decoder
+        if latest and self._video_source(self.video_path) != latest.path:
+            # Switch to a larger proxy (or the original) if the window outgrew it
+            self.set_video(self.video_path)
         super().resizeEvent(ev)
         
     def show_context_menu(self, pos):
@@ -762,6 +3959,318 @@ class PresenterWindow(QWidget):
         # Show the menu at the cursor position
         menu.exec_(self.mapToGlobal(pos))
 
+def presenter_message(**message):
+    """Encode one command or event for the presenter socket: a line of JSON."""
+    return (json.dumps(message) + "\n").encode('utf-8')
+
+def read_presenter_messages(sock):
+    """Decode the complete messages waiting on a presenter socket."""
+    messages = []
+    while sock.canReadLine():
+        line = bytes(sock.readLine()).strip()
+        if not line:
+            continue
+        try:
+            messages.append(json.loads(line.decode('utf-8')))
+        except ValueError as e:
+            print(f"Bad presenter message: {e}")
+    return messages
+
+def presenter_running(name=PRESENTER_SERVER_NAME):
+    """Whether a live presenter is listening on name, as opposed to a
+    socket file left behind by one that crashed."""
+    probe = QLocalSocket()
+    probe.connectToServer(name)
+    running = probe.waitForConnected(500)
+    if running:
+        probe.disconnectFromServer()
+    return running
+
+class PresenterServer(QObject):
+    """Runs in the presenter process and applies the commands of the
+    control window, which connects over a local socket.
+
+    When the control window goes away the presenter keeps showing what it
+    shows, so a crash there does not blank the projector; a restarted
+    control window reconnects to it. A hidden presenter left without a
+    control window exits.
+    """
+
+    def __init__(self, presenter, name=PRESENTER_SERVER_NAME):
+        super().__init__(presenter)
+        self.presenter = presenter
+        self.client = None
+        self.server = QLocalServer(self)
+        if presenter_running(name):
+            raise RuntimeError(f"A presenter is already running on {name}")
+        QLocalServer.removeServer(name)       # left behind by a crashed presenter
+        if not self.server.listen(name):
+            raise RuntimeError(f"Could not listen on {name}: {self.server.errorString()}")
+        self.server.newConnection.connect(self._on_connection)
+        presenter.visibilityChanged.connect(self._send_visible)
+        presenter.installEventFilter(self)
+        self.handlers = {
+            'set_lyric': lambda m: presenter.set_lyric(m.get('text', ''), m.get('next', '')),
+            'set_title': lambda m: setattr(presenter, 'current_song_title', m.get('title', '')),
+            'set_video': lambda m: presenter.set_video(m.get('path')),
+            'release_videos': self._release_videos,
+            'style': lambda m: presenter.update_settings(m.get('settings', {})),
+            'blackout': lambda m: presenter.set_blackout(m.get('on', False)),
+            'prefetch': lambda m: presenter.prefetch_lyrics(m.get('texts', [])),
+            'show': lambda m: presenter.show(),
+            'hide': lambda m: presenter.hide(),
+            'quit': lambda m: QApplication.quit(),
+        }
+
+    def _on_connection(self):
+        # A connection becomes the control window once it sends a command;
+        # one that never does (see presenter_running) changes nothing
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            sock.readyRead.connect(self._on_ready_read)
+            sock.disconnected.connect(self._on_disconnected)
+            sock.disconnected.connect(sock.deleteLater)
+
+    def _adopt(self, sock):
+        # One control window at a time; a newer one replaces the old
+        if self.client is not None:
+            self.client.disconnectFromServer()
+        self.client = sock
+        self._send_visible(self.presenter.isVisible())
+        self._send_size()
+
+    def _on_disconnected(self):
+        if self.sender() is not self.client:
+            return
+        self.client = None
+        if not self.presenter.isVisible():
+            QApplication.quit()
+
+    def _on_ready_read(self):
+        sock = self.sender()
+        if sock is not self.client:
+            self._adopt(sock)
+        for message in read_presenter_messages(sock):
+            handler = self.handlers.get(message.get('cmd'))
+            if handler is None:
+                print(f"Unknown presenter command: {message.get('cmd')}")
+                continue
+            try:
+                handler(message)
+            except Exception as e:
+                print(f"Presenter command {message.get('cmd')} failed: {e}")
+
+    def _send(self, **message):
+        if self.client is not None and self.client.state() == QLocalSocket.ConnectedState:
+            self.client.write(presenter_message(**message))
+
+    def _release_videos(self, message):
+        # The control window waits for this before renaming a file
+        self.presenter.release_videos()
+        self._send(event='released', id=message.get('id'))
+        self.client.flush()
+
+    def _send_visible(self, visible):
+        self._send(event='visible', visible=visible)
+
+    def _send_size(self):
+        self._send(event='size', width=self.presenter.width(), height=self.presenter.height())
+
+    def eventFilter(self, obj, event):
+        if obj is self.presenter and event.type() == QEvent.Resize:
+            self._send_size()
+        return False
+
+class PresenterClient(QObject):
+    """Stand-in for PresenterWindow in the control window, driving a
+    presenter that runs in its own process.
+
+    Commands are written to the presenter's local socket and never wait
+    for it, so nothing the control window does can hold up a frame. The
+    presenter process is started on demand and restarted if it dies;
+    it then gets the current style, video, lyric and blackout again.
+    """
+    visibilityChanged = pyqtSignal(bool)
+
+    def __init__(self, settings, name=PRESENTER_SERVER_NAME, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.settings = dict(settings)
+        self.video_path = None
+        self._title = ''
+        self._lyric = None               # last (text, next) sent
+        self._blackout = False
+        self._visible = None             # None until the control window sets it
+        self._closing = False
+        self._spawned_at = None
+        self._size = QSize(1000, 600)
+        self._release_id = 0
+        self._released_id = None         # id of the last release the presenter confirmed
+        # Lays out text like the presenter does, for slide_area
+        self._layout = CompositorWidget()
+        self._layout.set_style(self.settings)
+        self._layout.set_next_visible(self.settings.get('show_next_line', False))
+        self.socket = QLocalSocket(self)
+        self.socket.connected.connect(self._on_connected)
+        self.socket.disconnected.connect(self._on_disconnected)
+        self.socket.error.connect(self._on_socket_error)
+        self.socket.readyRead.connect(self._on_ready_read)
+        self._retry = QTimer(self)
+        self._retry.setSingleShot(True)
+        self._retry.setInterval(200)
+        self._retry.timeout.connect(self._connect)
+        self._connect()
+
+    # --- connection ---
+
+    def _connect(self):
+        if not self._closing and self.socket.state() == QLocalSocket.UnconnectedState:
+            self.socket.connectToServer(self.name)
+
+    def _spawn(self):
+        """Start a presenter process, unless one was started moments ago."""
+        now = time.monotonic()
+        if self._spawned_at is not None and now - self._spawned_at < PRESENTER_RESPAWN_INTERVAL:
+            return
+        self._spawned_at = now
+        args = [] if getattr(sys, 'frozen', False) else [os.path.abspath(__file__)]
+        ok, _ = QProcess.startDetached(sys.executable, args + ['--presenter', self.name], BASE_DIR)
+        if not ok:
+            print("Could not start the presenter process")
+
+    def _on_socket_error(self, error):
+        if self._closing:
+            return
+        if error in (QLocalSocket.ServerNotFoundError, QLocalSocket.ConnectionRefusedError):
+            # No presenter running (yet): start one and keep trying
+            self._spawn()
+            self._retry.start()
+        elif error != QLocalSocket.PeerClosedError:
+            print(f"Presenter connection error: {self.socket.errorString()}")
+
+    def _on_connected(self):
+        # Bring a new or restarted presenter up to date
+        self._send(cmd='style', settings=self.settings)
+        self._send(cmd='set_title', title=self._title)
+        if self.video_path:
+            self._send(cmd='set_video', path=self.video_path)
+        if self._lyric is not None:
+            self._send(cmd='set_lyric', text=self._lyric[0], next=self._lyric[1])
+        if self._blackout:
+            self._send(cmd='blackout', on=True)
+        if self._visible is not None:
+            self._send(cmd='show' if self._visible else 'hide')
+
+    def _on_disconnected(self):
+        if not self._closing:
+            print("Presenter process went away, restarting it")
+            self._retry.start()
+
+    def _on_ready_read(self):
+        for message in read_presenter_messages(self.socket):
+            event = message.get('event')
+            if event == 'visible':
+                self.visibilityChanged.emit(bool(message.get('visible')))
+            elif event == 'size':
+                self._size = QSize(message.get('width', 1000), message.get('height', 600))
+            elif event == 'released':
+                self._released_id = message.get('id')
+
+    def _send(self, **message):
+        if self.socket.state() == QLocalSocket.ConnectedState:
+            self.socket.write(presenter_message(**message))
+
+    # --- PresenterWindow interface ---
+
+    @property
+    def current_song_title(self):
+        return self._title
+
+    @current_song_title.setter
+    def current_song_title(self, title):
+        self._title = title
+        self._send(cmd='set_title', title=title)
+
+    def show(self):
+        self._visible = True
+        self._send(cmd='show')
+
+    def hide(self):
+        self._visible = False
+        self._send(cmd='hide')
+
+    def close(self):
+        """Shut the presenter process down."""
+        self._closing = True
+        self._retry.stop()
+        if self.socket.state() == QLocalSocket.ConnectedState:
+            self.socket.write(presenter_message(cmd='quit'))
+            self.socket.flush()
+            self.socket.disconnectFromServer()
+        self._layout.deleteLater()
+
+    def update_settings(self, settings):
+        self.settings.update(settings)
+        self._layout.set_style(self.settings)
+        self._layout.set_next_visible(self.settings.get('show_next_line', False))
+        self._send(cmd='style', settings=settings)
+
+    def set_video(self, path):
+        self.video_path = path
+        self._send(cmd='set_video', path=path)
+
+    def release_videos(self, timeout=PRESENTER_RELEASE_TIMEOUT):
+        """Have the presenter close its video files, waiting until it has.
+
+        Unlike the other commands this blocks, as the caller is about to
+        rename or delete a file the presenter may have open. Returns False
+        if the presenter did not confirm within timeout seconds.
+        """
+        self.video_path = None
+        if self.socket.state() != QLocalSocket.ConnectedState:
+            return False
+        self._release_id += 1
+        self._send(cmd='release_videos', id=self._release_id)
+        self.socket.flush()
+        deadline = time.monotonic() + timeout
+        while self._released_id != self._release_id:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.socket.state() != QLocalSocket.ConnectedState:
+                return False
+            if self.socket.waitForReadyRead(int(remaining * 1000) + 1):
+                self._on_ready_read()
+        return True
+
+    def set_lyric(self, text, next_lyric=''):
+        self._lyric = (text, next_lyric)
+        self._send(cmd='set_lyric', text=text, next=next_lyric)
+
+    def set_blackout(self, blackout):
+        self._blackout = blackout
+        self._send(cmd='blackout', on=blackout)
+
+    def prefetch_lyrics(self, texts):
+        self._send(cmd='prefetch', texts=list(texts))
+
+    def slide_area(self):
+        return self._layout.slide_area(self._size)
+
+def run_presenter(name=PRESENTER_SERVER_NAME):
+    """Entry point of the presenter process (see PresenterClient)."""
+    app = QApplication(sys.argv)
+    # Closing the window only hides the output; the control window decides
+    # when the process ends
+    app.setQuitOnLastWindowClosed(False)
+    presenter = PresenterWindow()
+    try:
+        server = PresenterServer(presenter, name)
+    except RuntimeError as e:
+        print(e)
+        return 1
+    # Stop the decoder threads before the process exits
+    app.aboutToQuit.connect(presenter.close)
+    return app.exec_()
+
 class SlideWidget(QWidget):
     def __init__(self, text, play_cb, edit_cb, del_cb, icons_on_left=True):
         super().__init__()
@@ -956,10 +4465,34 @@ class MainWindow(QMainWindow):
             self.splash.set_status("Loading settings...")
         self.defaults = load_defaults()
         
+        # Video library metadata, probed in the background
+        self.video_metadata = VideoMetadataIndex(VIDEO_METADATA_FILE, INDEX_WRITE_BATCH)
+        self.keyframe_index = KeyframeIndex(KEYFRAME_INDEX_FILE, INDEX_WRITE_BATCH)
+        self.metadata_thread = None
+        self.presenting = False          # background work waits while the presenter shows
+        # Thumbnails are made off the GUI thread, rows on screen first
+        self.thumbnail_atlas = ThumbnailAtlas(THUMBNAIL_DIR)
+        self.thumbnail_pixmaps = ThumbnailPixmapCache()
+        self.thumbnail_pool = ThumbnailPool(self.thumbnail_atlas, parent=self)
+        self.thumbnail_pool.ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_pool.error.connect(print)
+        # Hover-scrub filmstrips, made one at a time behind the thumbnails
+        self.filmstrips = FilmstripCache(FILMSTRIP_DIR)
+        self.filmstrip_pool = ThumbnailPool(self.filmstrips, workers=1, parent=self)
+        self.filmstrip_pool.error.connect(print)
+        self.scrubbing = None            # path of the row being scrubbed
+        # The video list paints rows from this model as they come on screen
+        self.video_model = VideoLibraryModel(self.video_metadata, self.thumbnail_pixmaps,
+                                             self.thumbnail_atlas, parent=self)
+        
         # Initialize presenter window
         if self.splash:
             self.splash.set_status("Preparing presenter...")
-        self.presenter = PresenterWindow()
+        if self.defaults.get('presenter_process', True):
+            # Projector output in its own process, so nothing here can stall it
+            self.presenter = PresenterClient(self.defaults, parent=self)
+        else:
+            self.presenter = PresenterWindow()
         
         # Ensure presenter closes when main window closes
         self.destroyed.connect(self.cleanup)
@@ -1114,6 +4647,20 @@ class MainWindow(QMainWindow):
         self.focus_btn.clicked.connect(self.toggle_focus_mode)
         top_bar.addWidget(self.focus_btn)
         
+        # Blackout button (toggle): blanks the projector without stopping it
+        self.blackout_btn = QPushButton("Blackout")
+        self.blackout_btn.setCheckable(True)
+        self.blackout_btn.setShortcut("B")
+        self.blackout_btn.setStyleSheet(button_style + """
+            QPushButton:checked {
+                background-color: #343a40;
+                border-color: #23272b;
+                color: white;
+            }
+        """)
+        self.blackout_btn.toggled.connect(lambda on: self.presenter.set_blackout(on))
+        top_bar.addWidget(self.blackout_btn)
+        
 
         # Start Presenter button
         self.start_btn = QPushButton("\u25B6 Start Presenting")  
@@ -1230,6 +4777,12 @@ class MainWindow(QMainWindow):
         add_lyrics_btn.clicked.connect(lambda: self.new_slide(self.song_select.currentIndex()))
         song_list_layout.addWidget(add_lyrics_btn)
         
+        # Paste a whole song and split it into slides that fit the screen
+        paste_song_btn = QPushButton("Paste Song...")
+        paste_song_btn.setStyleSheet(add_lyrics_btn.styleSheet())
+        paste_song_btn.clicked.connect(lambda: self.paste_song(self.song_select.currentIndex()))
+        song_list_layout.addWidget(paste_song_btn)
+        
         # Add the container to the main layout
         content_layout.addWidget(song_list_container, 1)  # Add stretch to make it expandable
 
@@ -1323,18 +4876,51 @@ class MainWindow(QMainWindow):
         rename_video_btn.clicked.connect(self.rename_video)
         video_input_bar.addWidget(rename_video_btn)
 
+        # Build Proxies button
+        self.build_proxies_btn = QPushButton("Build Proxies")
+        self.build_proxies_btn.setToolTip("Create smaller, fast-seeking copies of the videos for presenting")
+        self.build_proxies_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #6c757d;
+                color: white;
+                border: 1px solid #5a6268;
+                border-radius: 4px;
+                padding: 8px 16px;
+                font-size: 13px;
+                font-weight: 500;
+                min-width: 110px;
+            }
+            QPushButton:hover {
+                background-color: #5a6268;
+                border-color: #545b62;
+            }
+            QPushButton:pressed {
+                background-color: #545b62;
+            }
+            QPushButton:disabled {
+                background-color: #adb5bd;
+                border-color: #adb5bd;
+            }
+        """)
+        self.build_proxies_btn.clicked.connect(self.build_proxies)
+        video_input_bar.addWidget(self.build_proxies_btn)
+
         # Download progress bar
         self.progress = QProgressBar()
         video_section.addWidget(self.progress)
 
         # Video list in single column with thumbnails
-        self.video_list = QListWidget()
-        self.video_list.setViewMode(QListWidget.ListMode)
-        self.video_list.setResizeMode(QListWidget.Adjust)
-        self.video_list.setMovement(QListWidget.Static)
+        # (a model/view list: only the rows on screen are painted)
+        self.video_list = QListView()
+        self.video_list.setModel(self.video_model)
+        self.video_list.setItemDelegate(VideoItemDelegate(self.video_list))
+        self.video_list.setViewMode(QListView.ListMode)
+        self.video_list.setResizeMode(QListView.Adjust)
+        self.video_list.setMovement(QListView.Static)
+        self.video_list.setUniformItemSizes(True)
         self.video_list.setSpacing(8)
         self.video_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #f8f9fa;
                 border: 1px solid #dee2e6;
                 border-radius: 8px;
@@ -1342,25 +4928,31 @@ class MainWindow(QMainWindow):
                 font-size: 13px;
                 outline: none;
             }
-            QListWidget::item {
+            QListView::item {
                 background-color: white;
                 border: 1px solid #e0e0e0;
                 border-radius: 6px;
                 padding: 10px 12px;
                 margin: 4px 0;
-                min-height: 90px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e8f5e9;
                 border: 1px solid #c8e6c9;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f1f8ff;
                 border: 2px solid #bbdefb;
             }
         """)
         video_section.addWidget(self.video_list)
-        self.video_list.itemClicked.connect(lambda it: self.on_video(self.video_list.row(it)))
+        self.video_list.clicked.connect(lambda index: self.on_video(index.row()))
+        self.video_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.video_list.verticalScrollBar().valueChanged.connect(
+            lambda _: self.request_visible_thumbnails())
+        # Hovering a row scrubs through its filmstrip
+        self.video_list.setMouseTracking(True)
+        self.video_list.viewport().installEventFilter(self)
+        self.video_list.customContextMenuRequested.connect(self.show_video_context_menu)
 
         # Set window size and center on screen
         self.resize(1000, 700)
@@ -1394,7 +4986,7 @@ class MainWindow(QMainWindow):
             self.show()
 
         # If no videos yet, auto-download defaults
-        if self.video_list.count() == 0 and DEFAULT_VIDEO_URLS:
+        if self.video_model.rowCount() == 0 and DEFAULT_VIDEO_URLS:
             # Create a simple progress dialog
             progress = QDialog(self)
             progress.setWindowTitle("Downloading Default Videos")
@@ -1434,8 +5026,8 @@ class MainWindow(QMainWindow):
             self.refresh_ui()
 
         # If we have at least one video now, select & play it
-        if self.video_list.count() > 0:
-            self.video_list.setCurrentRow(0)
+        if self.video_model.rowCount() > 0:
+            self.video_list.setCurrentIndex(self.video_model.index(0))
             self.on_video(0)
 
     def start_download(self, url):
@@ -1468,6 +5060,16 @@ class MainWindow(QMainWindow):
     
     def cleanup(self):
         """Clean up resources when closing the application."""
+        if getattr(self, 'proxy_thread', None) and self.proxy_thread.isRunning():
+            self.proxy_thread.cancel()
+            self.proxy_thread.wait()
+        if getattr(self, 'metadata_thread', None) and self.metadata_thread.isRunning():
+            self.metadata_thread.cancel()
+            self.metadata_thread.wait()
+        if getattr(self, 'thumbnail_pool', None):
+            self.thumbnail_pool.stop()
+        if getattr(self, 'filmstrip_pool', None):
+            self.filmstrip_pool.stop()
         if hasattr(self, 'presenter') and self.presenter:
             self.presenter.close()
             self.presenter = None
@@ -1498,6 +5100,12 @@ class MainWindow(QMainWindow):
             
     def on_presenter_visibility_changed(self, visible):
         """Handle changes in presenter window visibility."""
+        # Leave the CPU to video playback while presenting
+        self.presenting = visible
+        self.thumbnail_pool.set_paused(visible)
+        self.filmstrip_pool.set_paused(visible)
+        if self.metadata_thread:
+            self.metadata_thread.set_paused(visible)
         if hasattr(self, 'start_btn'):
             self.start_btn.setChecked(visible)
             self.start_btn.setText("■ Stop Presenting" if visible else "▶ Start Presenting")
@@ -1522,7 +5130,7 @@ class MainWindow(QMainWindow):
             self.update()
 
         # If no videos yet, auto-download defaults
-        if self.video_list.count() == 0 and DEFAULT_VIDEO_URLS:
+        if self.video_model.rowCount() == 0 and DEFAULT_VIDEO_URLS:
             # Create a simple progress dialog
             progress = QDialog(self)
             progress.setWindowTitle("Downloading Videos")
@@ -1549,8 +5157,8 @@ class MainWindow(QMainWindow):
          # 3) reload video list
          self.load_videos()
          # optionally, re-auto-select first video:
-         if self.video_list.count():
-             self.video_list.setCurrentRow(0)
+         if self.video_model.rowCount():
+             self.video_list.setCurrentIndex(self.video_model.index(0))
              self.on_video(0)
 
     def open_settings(self):
@@ -1572,13 +5180,7 @@ class MainWindow(QMainWindow):
                     json.dump(new_settings, f, indent=2)
                 
                 # Update the presenter with new settings
-                self.presenter.defaults = new_settings
-                self.presenter.show_next_line = new_settings.get('show_next_line', False)
-                self.presenter.apply_style()
-                
-                # Update the next line visibility
-                if hasattr(self.presenter, 'next_line_overlay'):
-                    self.presenter.next_line_overlay.setVisible(self.presenter.show_next_line)
+                self.presenter.update_settings(new_settings)
                 
                 return True
                 
@@ -1640,13 +5242,13 @@ class MainWindow(QMainWindow):
     def rename_video(self):
         """Rename the currently-selected video file on disk and in the UI."""
         # 1. Get selected item
-        item = self.video_list.currentItem()
-        if not item:
+        index = self.video_list.currentIndex()
+        if not index.isValid():
             QMessageBox.warning(self, "Rename Video", "Please select a video first.")
             return
 
         # 2. Extract old path/name
-        old_path = item.data(Qt.UserRole)
+        old_path = index.data(Qt.UserRole)
         old_name = os.path.basename(old_path)
         base, ext = os.path.splitext(old_name)
 
@@ -1662,11 +5264,8 @@ class MainWindow(QMainWindow):
 
         # 4. Stop any currently playing video in the presenter
         if hasattr(self, 'presenter') and self.presenter:
-            if hasattr(self.presenter, 'cap') and self.presenter.cap is not None:
-                self.presenter.cap.release()
-                self.presenter.cap = None
-            if hasattr(self.presenter, 'timer') and self.presenter.timer.isActive():
-                self.presenter.timer.stop()
+            if not self.presenter.release_videos():
+                print("Presenter did not confirm it closed its videos")
 
         # 5. Build new path and rename on disk
         new_filename = new_base.strip() + ext
@@ -1680,14 +5279,20 @@ class MainWindow(QMainWindow):
                                f"Could not rename file. Make sure the file is not in use.\n\nError: {e}")
             return
 
+        # Keep the video's loop points under its new name
+        points = load_loop_points()
+        if old_name in points:
+            points[new_filename] = points.pop(old_name)
+            save_loop_points(points)
+
         # 6. Refresh video list and re-select renamed file
-        current_row = self.video_list.currentRow()
+        current_row = self.video_list.currentIndex().row()
         self.load_videos()
         
         # Try to find and select the renamed file
-        for i in range(self.video_list.count()):
-            if self.video_list.item(i).data(Qt.UserRole) == new_path:
-                self.video_list.setCurrentRow(i)
+        for i in range(self.video_model.rowCount()):
+            if self.video_model.path(i) == new_path:
+                self.video_list.setCurrentIndex(self.video_model.index(i))
                 break
             # Count only actual lyrics (skip section headers)
             if 'text' in slide:
@@ -1753,8 +5358,8 @@ class MainWindow(QMainWindow):
                 item.setBackground(QColor(255, 255, 255))
         
         # Show the first video if available
-        if self.video_list.count() > 0 and not self.video_list.currentItem():
-            self.video_list.setCurrentRow(0)
+        if self.video_model.rowCount() > 0 and not self.video_list.currentIndex().isValid():
+            self.video_list.setCurrentIndex(self.video_model.index(0))
             self.on_video(0)
             
             # Connect the double click handler for the lyric item
@@ -1849,8 +5454,8 @@ class MainWindow(QMainWindow):
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
 
         # Show the first video if available
-        if self.video_list.count() > 0 and not self.video_list.currentItem():
-            self.video_list.setCurrentRow(0)
+        if self.video_model.rowCount() > 0 and not self.video_list.currentIndex().isValid():
+            self.video_list.setCurrentIndex(self.video_model.index(0))
             self.on_video(0)
                 
             # Connect the double click handler for the lyric item
@@ -2132,6 +5737,38 @@ class MainWindow(QMainWindow):
         # If cancelled or no text, return the original section
         return section
         
+    def paste_song(self, song_idx):
+        """Split a pasted song into slides that fit the presenter and add them."""
+        from nanoid import generate
+        
+        if song_idx == -1:
+            return
+        settings = load_defaults()
+        area = self.presenter.slide_area()
+        dialog = SplitLyricsDialog(self, settings, area)
+        if dialog.exec_() != QDialog.Accepted or not dialog.slides:
+            return
+        
+        song = self.songs[song_idx]
+        if dialog.replace_cb.isChecked():
+            song['lyrics'] = []
+        for slide in dialog.slides:
+            song['lyrics'].append({
+                'id': generate(),
+                'text': slide['text'],
+                'section': slide['section']
+            })
+        self.save_song(song_idx)
+        
+        # The slides were split to fit this size, so present them at it
+        if dialog.font_size() != settings['font_size']:
+            settings['font_size'] = dialog.font_size()
+            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, indent=2)
+            self.presenter.update_settings(settings)
+        
+        self.on_song(song_idx)
+
     def edit_slide(self, song_idx, idx):
         from nanoid import generate
         
@@ -2451,6 +6088,7 @@ class MainWindow(QMainWindow):
             # Set current song title in presenter and show only the title
             self.presenter.current_song_title = song['title']
             self.presenter.set_lyric('', ' ')  # Empty main text, space in next line
+            self.presenter.prefetch_lyrics(self.upcoming_lyrics(0))
         
         # Connect the double click handler for the lyric item
         self.lyric_list.itemDoubleClicked.connect(self.on_lyric_double_clicked)
@@ -2559,122 +6197,108 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to create song: {str(e)}")
 
-    def get_video_thumbnail(self, video_path):
-        """Generate a thumbnail from the first frame of the video"""
-        # Create thumbnails directory if it doesn't exist
-        thumbnails_dir = os.path.join(VIDEOS_DIR, '.thumbnails')
-        os.makedirs(thumbnails_dir, exist_ok=True)
-        
-        # Get thumbnail path
-        video_name = os.path.basename(video_path)
-        thumb_path = os.path.join(thumbnails_dir, f"{os.path.splitext(video_name)[0]}.jpg")
-        
-        # Generate thumbnail if it doesn't exist
-        if not os.path.exists(thumb_path):
-            try:
-                cap = cv2.VideoCapture(video_path)
-                ret, frame = cap.read()
-                if ret:
-                    frame = cv2.resize(frame, (160, 90))  # 16:9 aspect ratio
-                    cv2.imwrite(thumb_path, frame, [int(cv2.IMWRITE_JPEG_QUALITY), 90])
-                cap.release()
-            except Exception as e:
-                print(f"Error generating thumbnail for {video_path}: {e}")
-                return None
-        
-        return thumb_path if os.path.exists(thumb_path) else None
-
     def load_videos(self):
-        self.video_list.clear()
-        for fn in os.listdir(VIDEOS_DIR):
-            ext = os.path.splitext(fn)[1].lower()
-            if ext in VIDEO_EXTS:
-                item = QListWidgetItem()
-                item_path = os.path.join(VIDEOS_DIR, fn)
-                
-                # Get or generate thumbnail
-                thumb_path = self.get_video_thumbnail(item_path)
-                
-                # Create a widget for the video item
-                widget = QWidget()
-                layout = QHBoxLayout(widget)
-                layout.setContentsMargins(8, 8, 8, 8)
-                layout.setSpacing(12)
-                
-                # Thumbnail
-                thumbnail = QLabel()
-                thumbnail.setFixedSize(120, 70)  # Fixed size for thumbnails
-                thumbnail.setScaledContents(True)
-                thumbnail.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0f0f0;
-                        border-radius: 4px;
-                        border: 1px solid #e0e0e0;
-                    }
-                """)
-                
-                if thumb_path and os.path.exists(thumb_path):
-                    pixmap = QPixmap(thumb_path).scaled(120, 70, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    thumbnail.setPixmap(pixmap)
-                else:
-                    # Fallback to placeholder
-                    # Add play icon overlay for placeholder
-                    play_icon = QLabel(thumbnail)
-                    play_icon.setPixmap(self.style().standardIcon(QStyle.SP_MediaPlay).pixmap(24, 24))
-                    play_icon.setAlignment(Qt.AlignCenter)
-                    play_icon.setStyleSheet("background: transparent;")
-                    play_icon.setFixedSize(24, 24)
-                    play_icon.move(28, 10)
-                
-                # Video info
-                info_widget = QWidget()
-                info_layout = QVBoxLayout(info_widget)
-                info_layout.setContentsMargins(8, 0, 0, 0)
-                info_layout.setSpacing(4)
-                
-                # Filename with word wrap
-                name_label = QLabel(fn)
-                name_label.setWordWrap(True)
-                name_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 13px;
-                        color: #212529;
-                        font-weight: 500;
-                        padding: 2px 0;
-                        margin: 0;
-                    }
-                """)
-                
-                # File size and duration (placeholder - you can add actual duration if needed)
+        # Thumbnails still queued for the old list are not wanted any more
+        self.thumbnail_pool.cancel()
+        self.filmstrip_pool.cancel()
+        self.scrubbing = None
+        rows = []
+        with os.scandir(VIDEOS_DIR) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in VIDEO_EXTS:
+                    continue
                 try:
-                    size = os.path.getsize(item_path) / (1024 * 1024)  # MB
-                    size_str = f"{size:.1f} MB"
-                    info_label = QLabel(size_str)
-                    info_label.setStyleSheet("""
-                        QLabel {
-                            color: #6c757d;
-                            font-size: 11px;
-                            padding: 1px 0;
-                            margin: 0;
-                        }
-                    """)
-                    info_layout.addWidget(info_label)
-                except:
-                    pass
-                
-                info_layout.addWidget(name_label)
-                info_layout.addStretch()
-                
-                # Add widgets to layout
-                layout.addWidget(thumbnail)
-                layout.addWidget(info_widget, 1)  # Allow info widget to expand
-                
-                # Set the widget as the item's widget
-                item.setSizeHint(widget.sizeHint())
-                item.setData(Qt.UserRole, item_path)
-                self.video_list.addItem(item)
-                self.video_list.setItemWidget(item, widget)
-        self.video_list.itemClicked.connect(lambda it: self.on_video(self.video_list.row(it)))
+                    st = entry.stat()
+                except OSError:
+                    continue
+                # The only stat of the file; everything below reuses it
+                rows.append((entry.path, entry.name, (st.st_size, st.st_mtime_ns)))
+        # Rows are painted by the delegate as they scroll into view
+        self.video_model.set_videos(rows)
+        stats = self.video_model.stats()
+        self.thumbnail_pool.request(
+            [p for p, stat in stats.items() if self.thumbnail_atlas.lookup(p, stat) is None],
+            priority=1)
+        self.filmstrip_pool.request(list(stats))
+        # Lay the rows out now so the visible ones are known
+        self.video_list.doItemsLayout()
+        self.request_visible_thumbnails()
+        self.probe_videos()
+
+    def visible_video_rows(self):
+        """Return the range of rows at least partly on screen."""
+        count = self.video_model.rowCount()
+        viewport = self.video_list.viewport().rect()
+        if not count:
+            return range(0)
+        first = self.video_list.indexAt(viewport.topLeft() + QPoint(10, 1))
+        last = self.video_list.indexAt(viewport.bottomLeft() + QPoint(10, -1))
+        first = first.row() if first.isValid() else 0
+        last = last.row() if last.isValid() else count - 1
+        return range(first, last + 1)
+
+    def request_visible_thumbnails(self):
+        """Move the thumbnails of the rows on screen to the front of the queue."""
+        model = self.video_model
+        self.thumbnail_pool.request(
+            [model.path(row) for row in self.visible_video_rows()
+             if self.thumbnail_atlas.lookup(model.path(row), model.stat(row)) is None],
+            priority=0)
+
+    def eventFilter(self, obj, event):
+        if obj is self.video_list.viewport():
+            if event.type() == QEvent.MouseMove:
+                self.scrub_video(event.pos())
+            elif event.type() == QEvent.Leave:
+                self.end_scrub()
+        return super().eventFilter(obj, event)
+
+    def scrub_video(self, pos):
+        """Show the filmstrip frame under the mouse in the hovered row."""
+        index = self.video_list.indexAt(pos)
+        path = index.data(Qt.UserRole) if index.isValid() else None
+        if path != self.scrubbing:
+            self.end_scrub()
+        if path is None:
+            return
+        rect = self.video_list.visualRect(index)
+        frame = self.filmstrips.frame(path, (pos.x() - rect.left()) / max(1, rect.width()),
+                                      self.video_model.stat(index.row()))
+        if frame is not None:
+            self.scrubbing = path
+            self.video_model.set_scrub(path, frame)
+
+    def end_scrub(self):
+        """Put the thumbnail back on the row that was being scrubbed."""
+        if self.scrubbing is not None:
+            self.video_model.set_scrub(None, None)
+        self.scrubbing = None
+
+    def on_thumbnail_ready(self, path):
+        self.video_model.refresh(path)
+
+    def probe_videos(self):
+        """Fill in the metadata of listed videos the index does not know yet."""
+        stats = self.video_model.stats()
+        paths = list(stats)
+        self.video_metadata.prune(paths)
+        self.thumbnail_atlas.prune(paths)
+        self.filmstrips.prune(paths, stats)
+        missing = [p for p, stat in stats.items() if self.video_metadata.get(p, stat) is None]
+        # Hand the list to a probe that is still running rather than wait for it
+        if self.metadata_thread and self.metadata_thread.add(missing):
+            return
+        if not missing:
+            return
+        self.metadata_thread = MetadataProbeThread(self.video_metadata, self.keyframe_index,
+                                                   missing, parent=self)
+        self.metadata_thread.probed.connect(self.on_video_probed)
+        self.metadata_thread.error.connect(lambda msg: print(f"Metadata error: {msg}"))
+        self.metadata_thread.set_paused(self.presenting)
+        self.metadata_thread.start()
+
+    def on_video_probed(self, path, meta):
+        self.video_model.refresh(path)
 
     def sanitize_filename(self, filename):
         """Remove invalid characters from filename and ensure it's safe for Windows."""
@@ -2863,6 +6487,105 @@ class MainWindow(QMainWindow):
         elif d.get('status') == 'finished':
             self.progress.setValue(100)
 
+    def build_proxies(self):
+        """Transcode presentation proxies for every video in the list."""
+        paths = self.video_model.paths()
+        if not paths:
+            return
+        self.build_proxies_btn.setEnabled(False)
+        self.progress.setValue(0)
+        self.proxy_thread = ProxyTranscodeThread(paths, parent=self)
+        self.proxy_thread.progress.connect(self.progress.setValue)
+        self.proxy_thread.error.connect(lambda msg: print(f"Proxy error: {msg}"))
+        self.proxy_thread.finished.connect(self.on_proxies_built)
+        self.proxy_thread.start()
+
+    def on_proxies_built(self, count):
+        print(f"Built {count} proxy video(s)")
+        self.build_proxies_btn.setEnabled(True)
+        # Reopen the current video so a new proxy is picked up
+        if count and self.presenter and self.presenter.video_path:
+            self.presenter.set_video(self.presenter.video_path)
+
+    def show_video_context_menu(self, position):
+        """Show context menu for video items."""
+        index = self.video_list.indexAt(position)
+        if not index.isValid():
+            return
+        path = index.data(Qt.UserRole)
+        
+        menu = QMenu()
+        loop_action = menu.addAction("Set Loop Points...")
+        clear_action = menu.addAction("Clear Loop Points")
+        clear_action.setEnabled(os.path.basename(path) in load_loop_points())
+        
+        loop_action.triggered.connect(lambda checked, p=path: self.edit_loop_points(p))
+        clear_action.triggered.connect(lambda checked, p=path: self.clear_loop_points(p))
+        
+        menu.exec_(self.video_list.viewport().mapToGlobal(position))
+
+    def edit_loop_points(self, path):
+        """Let the user pick the part of a video that is looped."""
+        cap = cv2.VideoCapture(path)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        duration = cap.get(cv2.CAP_PROP_FRAME_COUNT) / fps
+        cap.release()
+        
+        points = load_loop_points()
+        current = points.get(os.path.basename(path), {})
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Loop Points")
+        dialog.setWindowFlags(dialog.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        layout = QFormLayout(dialog)
+        
+        in_spin = QDoubleSpinBox()
+        in_spin.setRange(0.0, max(0.0, duration))
+        in_spin.setDecimals(2)
+        in_spin.setSingleStep(0.1)
+        in_spin.setSuffix(' s')
+        in_spin.setValue(current.get('in', 0.0))
+        
+        out_spin = QDoubleSpinBox()
+        out_spin.setRange(0.0, max(0.0, duration))
+        out_spin.setDecimals(2)
+        out_spin.setSingleStep(0.1)
+        out_spin.setSuffix(' s')
+        out_spin.setSpecialValueText("End of clip")
+        out_spin.setValue(current.get('out', 0.0))
+        
+        layout.addRow(QLabel(f"Clip length: {duration:.2f} s"))
+        layout.addRow("Loop in:", in_spin)
+        layout.addRow("Loop out:", out_spin)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
+        layout.addRow(button_box)
+        
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        loop_in, loop_out = in_spin.value(), out_spin.value()
+        if loop_out and loop_out <= loop_in:
+            QMessageBox.warning(self, "Loop Points", "The out point must come after the in point.")
+            return
+        if loop_in or loop_out:
+            points[os.path.basename(path)] = {'in': loop_in, 'out': loop_out}
+        else:
+            points.pop(os.path.basename(path), None)
+        save_loop_points(points)
+        
+        # Restart the video if it is the one playing
+        if self.presenter and self.presenter.video_path == path:
+            self.presenter.set_video(path)
+
+    def clear_loop_points(self, path):
+        points = load_loop_points()
+        if points.pop(os.path.basename(path), None) is not None:
+            save_loop_points(points)
+            if self.presenter and self.presenter.video_path == path:
+                self.presenter.set_video(path)
+
     def add_video(self):
         url = self.video_url.text().strip()
         if url:
@@ -2916,25 +6639,35 @@ class MainWindow(QMainWindow):
             
             # Get current and next lyric text
             current_text = data['text']
-            next_text = ''
-            
-            # Find the next selectable lyric item
-            current_row = self.lyric_list.row(item)
-            for row in range(current_row + 1, self.lyric_list.count()):
-                next_item = self.lyric_list.item(row)
-                if next_item.flags() & Qt.ItemIsSelectable:
-                    next_data = next_item.data(Qt.UserRole)
-                    if isinstance(next_data, dict) and 'text' in next_data:
-                        next_text = next_data['text']
-                    break
+            upcoming = self.upcoming_lyrics(self.lyric_list.row(item) + 1)
+            next_text = upcoming[0] if upcoming else ''
                     
             self.presenter.set_lyric(current_text, next_text)
+            self.presenter.prefetch_lyrics(upcoming)
+
+    def upcoming_lyrics(self, first_row, count=LYRIC_LOOKAHEAD):
+        """Return the text of up to count selectable slides from first_row on."""
+        texts = []
+        for row in range(first_row, self.lyric_list.count()):
+            if len(texts) >= count:
+                break
+            next_item = self.lyric_list.item(row)
+            if next_item.flags() & Qt.ItemIsSelectable:
+                next_data = next_item.data(Qt.UserRole)
+                if isinstance(next_data, dict) and 'text' in next_data:
+                    texts.append(next_data['text'])
+        return texts
 
     def on_video(self, idx):
-        path = self.video_list.item(idx).data(Qt.UserRole)
+        path = self.video_model.path(idx)
         self.presenter.set_video(path)
 
 if __name__ == '__main__':
+    if '--presenter' in sys.argv:
+        # Started by PresenterClient as the separate presenter process
+        args = sys.argv[sys.argv.index('--presenter') + 1:]
+        sys.exit(run_presenter(args[0] if args else PRESENTER_SERVER_NAME))
+    
     app = QApplication(sys.argv)
     
     # Initial setup
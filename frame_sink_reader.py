@@ -0,0 +1,147 @@
+"""Reference reader for the presenter's shared-memory frame sink.
+
+Attaches to the segment written by SharedFrameSink in _app.py (enable
+"frame_sink" in the settings), follows the newest frame and reports how
+many frames arrive and how old they are when seen. Pixels are read in
+place; nothing is copied unless --save is given.
+
+    python frame_sink_reader.py                      # print stats every second
+    python frame_sink_reader.py --seconds 10         # benchmark for 10 seconds
+    python frame_sink_reader.py --save frame.png     # write the newest frame
+"""
+import argparse
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+MAGIC = b"JSGCFRM1"
+VERSION = 1
+FORMAT_BGRA = 1
+HEADER = struct.Struct('<8s6I2Q')
+SLOT = struct.Struct('<Qd')
+HEADER_SIZE = 64
+SLOT_HEADER_SIZE = 64
+LATEST_OFFSET = HEADER.size - 8
+
+
+def attach(name):
+    """Open an existing segment without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13 the resource tracker would remove the
+        # presenter's segment when this reader exits
+        shm = shared_memory.SharedMemory(name)
+        if hasattr(resource_tracker, 'unregister') and sys.platform != 'win32':
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class FrameSinkReader:
+    def __init__(self, name):
+        self.shm = attach(name)
+        magic, version, self.slots, self.width, self.height, self.stride, self.format, \
+            self.slot_size, _ = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.shm.close()
+            raise ValueError(f"{name} is not a version {VERSION} frame sink")
+        self._views = []
+        for i in range(self.slots):
+            offset = HEADER_SIZE + i * self.slot_size + SLOT_HEADER_SIZE
+            pixels = np.ndarray((self.height, self.stride), np.uint8, self.shm.buf, offset)
+            self._views.append(pixels[:, :self.width * 4].reshape(self.height, self.width, 4))
+
+    def latest(self):
+        return struct.unpack_from('<Q', self.shm.buf, LATEST_OFFSET)[0]
+
+    def slot_stamp(self, seq):
+        """Return (seq, timestamp) currently in the slot that holds seq."""
+        return SLOT.unpack_from(self.shm.buf, HEADER_SIZE + (seq % self.slots) * self.slot_size)
+
+    def frame(self, seq):
+        """Return a BGRA view of frame seq, or None if it was overwritten.
+
+        The view points into shared memory: check still_valid(seq) after
+        using it to be sure the writer did not reuse the slot meanwhile.
+        """
+        if seq == 0 or self.slot_stamp(seq)[0] != seq:
+            return None
+        return self._views[seq % self.slots]
+
+    def still_valid(self, seq):
+        return self.slot_stamp(seq)[0] == seq
+
+    def close(self):
+        self._views = []
+        self.shm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--name', default='jsgc-presenter-frames', help="segment name (frame_sink_name)")
+    parser.add_argument('--seconds', type=float, default=0, help="stop after this long (0 runs until Ctrl+C)")
+    parser.add_argument('--save', help="write the newest frame to this image file and exit")
+    args = parser.parse_args()
+
+    try:
+        reader = FrameSinkReader(args.name)
+    except FileNotFoundError:
+        sys.exit(f"No frame sink named {args.name}; is the presenter running with frame_sink on?")
+    print(f"{args.name}: {reader.width}x{reader.height}, {reader.slots} slots, format {reader.format}")
+
+    try:
+        if args.save:
+            import cv2
+            seq = reader.latest()
+            frame = reader.frame(seq)
+            if frame is None:
+                sys.exit("No complete frame yet")
+            image = frame.copy()
+            if not reader.still_valid(seq):
+                sys.exit("Frame was overwritten while copying; try again")
+            cv2.imwrite(args.save, image)
+            print(f"Saved frame {seq} to {args.save}")
+            return
+
+        start = time.monotonic()
+        report = start + 1.0
+        last = reader.latest()
+        seen = missed = torn = 0
+        ages = []
+        while not args.seconds or time.monotonic() - start < args.seconds:
+            seq = reader.latest()
+            if seq == last:
+                time.sleep(0.001)
+                continue
+            missed += max(0, seq - last - 1)
+            last = seq
+            frame = reader.frame(seq)
+            if frame is None:
+                torn += 1
+                continue
+            # Touch the pixels the way a consumer would, without copying
+            checksum = int(frame[::64, ::64, :3].sum())
+            stamp = reader.slot_stamp(seq)[1]
+            if not reader.still_valid(seq):
+                torn += 1
+                continue
+            seen += 1
+            ages.append(time.time() - stamp)
+            if time.monotonic() >= report:
+                avg_age = 1000 * sum(ages) / len(ages) if ages else 0.0
+                print(f"frame {seq}: {seen} fps, {missed} skipped, {torn} overwritten, "
+                      f"age {avg_age:.1f} ms, checksum {checksum}")
+                seen = missed = torn = 0
+                ages = []
+                report += 1.0
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""Tests of the presenter's building blocks. Run with: python -m pytest tests"""
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# _app keeps its caches under the working directory
+_WORKDIR = tempfile.mkdtemp()
+_cwd = os.getcwd()
+os.chdir(_WORKDIR)
+try:
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QFont
+    app = QApplication.instance() or QApplication(sys.argv)
+    import _app
+finally:
+    os.chdir(_cwd)
+
+
+def touch(path, data=b"video"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+class ScaleFrameTest(unittest.TestCase):
+    def setUp(self):
+        # 200x100, with every column a different value
+        self.frame = np.repeat(np.arange(200, dtype=np.uint8)[None, :, None], 100, 0)
+        self.frame = np.repeat(self.frame, 3, 2)
+
+    def test_fit_keeps_aspect_ratio(self):
+        out = _app.scale_frame(self.frame, 100, 100, "fit")
+        self.assertEqual(out.shape, (50, 100, 3))
+
+    def test_fill_stretches_to_output(self):
+        out = _app.scale_frame(self.frame, 100, 100, "fill")
+        self.assertEqual(out.shape, (100, 100, 3))
+
+    def test_crop_is_a_centered_view(self):
+        out = _app.scale_frame(self.frame, 100, 100, "crop")
+        self.assertEqual(out.shape, (100, 100, 3))
+        self.assertTrue(np.shares_memory(out, self.frame))
+        np.testing.assert_array_equal(out, self.frame[:, 50:150])
+
+    def test_writes_into_dst_of_the_output_shape(self):
+        dst = np.empty((50, 100, 3), np.uint8)
+        self.assertIs(_app.scale_frame(self.frame, 100, 100, "fit", dst), dst)
+        wrong = np.empty((10, 10, 3), np.uint8)
+        self.assertIsNot(_app.scale_frame(self.frame, 100, 100, "fit", wrong), wrong)
+
+
+class FramePoolTest(unittest.TestCase):
+    def test_reuses_buffers_of_the_same_shape(self):
+        pool = _app.FramePool()
+        buf = pool.get((4, 4, 3))
+        pool.put(buf)
+        self.assertIs(pool.get((4, 4, 3)), buf)
+        self.assertIsNot(pool.get((4, 4, 3)), buf)
+
+    def test_ignores_views(self):
+        pool = _app.FramePool()
+        base = np.empty((8, 4, 3), np.uint8)
+        view = base[:4]
+        pool.put(view)
+        self.assertIsNot(pool.get((4, 4, 3)), view)
+
+    def test_limit_prefers_the_newest_shape(self):
+        pool = _app.FramePool(limit=2)
+        old = [np.empty((2, 2, 3), np.uint8) for _ in range(2)]
+        for buf in old:
+            pool.put(buf)
+        new = np.empty((4, 4, 3), np.uint8)
+        pool.put(new)
+        self.assertIs(pool.get((4, 4, 3)), new)
+        kept = pool.get((2, 2, 3))
+        self.assertTrue(any(kept is buf for buf in old))
+        self.assertFalse(any(pool.get((2, 2, 3)) is buf for buf in old))
+
+
+class ParseSongTextTest(unittest.TestCase):
+    def test_stanzas_and_sections(self):
+        text = "[Verse 1]\nAmazing grace\n how sweet \n\n\nThat saved\n[Chorus]\nMy chains"
+        self.assertEqual(_app.parse_song_text(text), [
+            ('Verse 1', ['Amazing grace', 'how sweet']),
+            ('Verse 1', ['That saved']),
+            ('Chorus', ['My chains']),
+        ])
+
+    def test_no_sections(self):
+        self.assertEqual(_app.parse_song_text("a\nb\n\nc\n"), [('', ['a', 'b']), ('', ['c'])])
+        self.assertEqual(_app.parse_song_text("\n\n"), [])
+
+
+class SlideSplitterTest(unittest.TestCase):
+    def setUp(self):
+        self.splitter = _app.SlideSplitter()
+        # Four lines fit on a slide, whatever the font
+        self.splitter.fits = lambda lines, font, width, height: len(lines) <= 4
+        self.font = QFont()
+
+    def test_splits_stanza_evenly(self):
+        song = "\n".join("line %d" % i for i in range(5))
+        slides = self.splitter.split(song, self.font, 800, 600)
+        self.assertEqual([s['text'].count("\n") + 1 for s in slides], [3, 2])
+
+    def test_never_spans_stanzas(self):
+        slides = self.splitter.split("[V]\na\nb\n\n[C]\nc", self.font, 800, 600)
+        self.assertEqual(slides, [{'text': 'a\nb', 'section': 'V'},
+                                  {'text': 'c', 'section': 'C'}])
+
+
+class FontFitterTest(unittest.TestCase):
+    def setUp(self):
+        self.fitter = _app.FontFitter()
+        self.font = QFont()
+
+    def test_finds_the_largest_size_that_fits(self):
+        text = "Amazing grace, how sweet the sound\nThat saved a wretch like me"
+        size = self.fitter.fit(text, self.font, 600, 200, 200)
+        self.assertGreater(size, _app.AUTO_FIT_MIN_SIZE)
+        self.assertLess(size, 200)
+        self.assertTrue(self.fitter._fits(text, self.font, size, 600, 200))
+        self.assertFalse(self.fitter._fits(text, self.font, size + 1, 600, 200))
+        self.assertFalse(self.fitter.overflows(text, self.font, 600, 200, 200))
+
+    def test_capped_at_max_size(self):
+        self.assertEqual(self.fitter.fit("Hi", self.font, 1000, 1000, 40), 40)
+
+    def test_overflow_at_min_size(self):
+        text = "\n".join(["word"] * 40)
+        self.assertEqual(self.fitter.fit(text, self.font, 100, 40, 80), _app.AUTO_FIT_MIN_SIZE)
+        self.assertTrue(self.fitter.overflows(text, self.font, 100, 40, 80))
+
+    def test_memoized(self):
+        size = self.fitter.fit("Hello", self.font, 300, 100, 90)
+        self.fitter._search = lambda *args: self.fail("measured again")
+        self.assertEqual(self.fitter.fit("Hello", self.font, 300, 100, 90), size)
+
+
+class LyricTransitionTest(unittest.TestCase):
+    def test_progress_is_clamped(self):
+        t = _app.LyricTransition("crossfade", 2.0, "a", "", start=10.0)
+        self.assertEqual(t.progress(9.0), 0.0)
+        self.assertEqual(t.progress(11.0), 0.5)
+        self.assertEqual(t.progress(13.0), 1.0)
+
+    def test_retarget_before_halfway_keeps_outgoing_text(self):
+        t = _app.LyricTransition("crossfade", 1.0, "a", "x", start=0.0)
+        t.retarget("crossfade", 1.0, "b", "y", now=0.3)
+        self.assertEqual((t.lyric_from, t.next_from), ("a", "x"))
+        self.assertAlmostEqual(t.progress(0.3), 0.3)
+
+    def test_retarget_past_halfway_continues_from_incoming_text(self):
+        t = _app.LyricTransition("crossfade", 1.0, "a", "x", start=0.0)
+        _, in_before, _, _ = t.mix(t.progress(0.7), 100)
+        t.retarget("slide", 1.0, "b", "y", now=0.7)
+        self.assertEqual((t.lyric_from, t.next_from), ("b", "y"))
+        self.assertEqual(t.kind, "slide")
+        self.assertAlmostEqual(t.progress(0.7), 0.3)
+        # The text on screen keeps its opacity across the retarget
+        out_after, _, _, _ = t.mix(t.progress(0.7), 100)
+        self.assertAlmostEqual(out_after, in_before)
+
+    def test_unknown_kind_crossfades(self):
+        self.assertEqual(_app.LyricTransition("spin", 1.0, "", "", 0.0).kind, "crossfade")
+
+
+class JsonIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(dir=_WORKDIR)
+        self.video = os.path.join(self.root, "song.mp4")
+        touch(self.video)
+        self.path = os.path.join(self.root, "index", "index.json")
+
+    def test_entry_goes_stale_when_the_video_changes(self):
+        index = _app.JsonIndex(self.path)
+        index.store(self.video, value=1)
+        self.assertEqual(index.lookup(self.video)['value'], 1)
+        touch(self.video, b"a longer video")
+        self.assertIsNone(index.lookup(self.video))
+        self.assertIsNone(index.store(os.path.join(self.root, "missing.mp4"), value=2))
+
+    def test_sees_entries_written_by_another_index(self):
+        reader = _app.JsonIndex(self.path)
+        self.assertIsNone(reader.lookup(self.video))
+        _app.JsonIndex(self.path).store(self.video, value=3)
+        self.assertEqual(reader.lookup(self.video)['value'], 3)
+
+    def test_batched_entries_are_written_by_flush(self):
+        writer = _app.JsonIndex(self.path, batch=10)
+        reader = _app.JsonIndex(self.path)
+        writer.store(self.video, value=4)
+        self.assertEqual(writer.lookup(self.video)['value'], 4)
+        self.assertIsNone(reader.lookup(self.video))
+        writer.flush()
+        self.assertEqual(reader.lookup(self.video)['value'], 4)
+
+    def test_prune(self):
+        index = _app.JsonIndex(self.path)
+        index.store(self.video, value=5)
+        index.prune([])
+        self.assertIsNone(_app.JsonIndex(self.path).lookup(self.video))
+
+
+class ProxyIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(dir=_WORKDIR)
+        self.video = os.path.join(self.root, "song.mp4")
+        touch(self.video)
+        self.index = _app.ProxyIndex(os.path.join(self.root, "proxies.json"))
+        # A 4:3 source: the proxies are narrower than their tiers
+        self.index.add(self.video, "preview", 480, 360)
+        self.index.add(self.video, "projector", 960, 720)
+        for tier in ("preview", "projector"):
+            touch(_app.proxy_path(self.video, tier))
+
+    def test_smallest_proxy_covering_the_output(self):
+        self.assertEqual(self.index.find(self.video, 480, 270),
+                         _app.proxy_path(self.video, "preview"))
+        # 640 wide is more than the preview proxy really has
+        self.assertEqual(self.index.find(self.video, 640, 360),
+                         _app.proxy_path(self.video, "projector"))
+
+    def test_falls_back_to_the_original(self):
+        self.assertEqual(self.index.find(self.video, 1920, 1080), self.video)
+        os.remove(_app.proxy_path(self.video, "projector"))
+        self.assertEqual(self.index.find(self.video, 640, 360), self.video)
+
+    def test_stale_when_the_video_changes(self):
+        touch(self.video, b"re-encoded video")
+        self.assertEqual(self.index.find(self.video, 480, 270), self.video)
+
+
+if __name__ == '__main__':
+    unittest.main()
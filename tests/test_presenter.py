@@ -0,0 +1,115 @@
+"""Presenter playback tests. Run with: python -m pytest tests"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import cv2
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# _app keeps its caches under the working directory
+_WORKDIR = tempfile.mkdtemp()
+_cwd = os.getcwd()
+os.chdir(_WORKDIR)
+try:
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    import _app
+finally:
+    os.chdir(_cwd)
+
+
+def write_video(path, color, frames=60, size=(160, 90), fps=25):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), fps, size)
+    for _ in range(frames):
+        writer.write(np.full((size[1], size[0], 3), color, np.uint8))
+    writer.release()
+
+
+def spin(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+class SuspendedSwitchTest(unittest.TestCase):
+    def setUp(self):
+        self.first = os.path.join(_WORKDIR, "first.avi")
+        self.second = os.path.join(_WORKDIR, "second.avi")
+        write_video(self.first, (0, 0, 255))
+        write_video(self.second, (0, 255, 0))
+        self.presenter = _app.PresenterWindow()
+        self.presenter.resize(320, 180)
+
+    def tearDown(self):
+        self.presenter.close()
+        spin(0.1)
+
+    def test_set_video_while_suspended(self):
+        presenter = self.presenter
+        # Never shown, so nothing is on screen
+        self.assertTrue(presenter._suspended)
+        presenter.set_video(self.first)
+        spin(0.5)
+        self.assertIsNotNone(presenter.decoder)
+
+        # With a cached first frame the switch crossfades at once, which
+        # while suspended promotes the new decoder straight away
+        frame = np.zeros((90, 160, 3), np.uint8)
+        presenter.first_frames.load = lambda *args: frame
+        presenter.set_video(self.second)
+        self.assertIsNone(presenter.incoming)
+        self.assertEqual(presenter.decoder.path, self.second)
+        self.assertTrue(presenter.decoder.isRunning())
+
+        # Shown again, the new video plays
+        presenter.show()
+        spin(0.5)
+        self.assertFalse(presenter._suspended)
+        self.assertTrue(presenter.timer.isActive())
+        self.assertIsNotNone(presenter.decoder.take_frame())
+
+
+class CrossfadeErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.first = os.path.join(_WORKDIR, "outgoing.avi")
+        self.second = os.path.join(_WORKDIR, "incoming.avi")
+        write_video(self.first, (0, 0, 255), frames=100)
+        write_video(self.second, (0, 255, 0), frames=100)
+        self.presenter = _app.PresenterWindow()
+        self.presenter.resize(320, 180)
+        self.presenter.defaults['video_crossfade_duration'] = 2.0
+
+    def tearDown(self):
+        self.presenter.close()
+        spin(0.1)
+
+    def test_incoming_error_keeps_outgoing_video(self):
+        presenter = self.presenter
+        presenter.show()
+        presenter.set_video(self.first)
+        spin(0.5)
+        outgoing = presenter.decoder
+        presenter.set_video(self.second)
+        spin(0.5)
+        self.assertIsNotNone(presenter._crossfade_anim)
+
+        presenter.incoming.error.emit("decode failed")
+        self.assertIsNone(presenter._crossfade_anim)
+        self.assertIsNone(presenter.incoming)
+        self.assertIsNone(presenter.compositor.incoming)
+        self.assertEqual(presenter.compositor.videoMix, 0.0)
+
+        # Past where the crossfade would have ended, the old video plays on
+        spin(2.2)
+        self.assertIs(presenter.decoder, outgoing)
+        self.assertTrue(presenter.timer.isActive())
+
+
+if __name__ == '__main__':
+    unittest.main()